@@ -6,16 +6,14 @@ This module provides the Orchestrator Agent implementation, responsible for
 coordinating the overall flow of tasks between specialized agents.
 """
 
-import os
 import json
 import asyncio
+import contextlib
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 # Import base agent
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from ai_agents.shared.base_agent import BaseAgent
 
 # Import ADK components
@@ -176,22 +174,26 @@ class OrchestratorAgent(BaseAgent):
             final_response = None
             
             # Process the task using the Orchestrator Agent
-            async for event in self.runner.run_async(
+            async with contextlib.aclosing(self.runner.run_async(
                 user_id=user_id,
                 session_id=session_id,
                 new_message=content
-            ):
-                # Check for the final response
-                if event.is_final_response() and event.content and event.content.parts:
-                    final_response = event.content.parts[0].text
-                    
-                    # Extract result from the response
-                    if "successfully completed" in final_response.lower():
-                        result["status"] = "completed"
-                    else:
-                        result["status"] = "failed"
-                    
-                    result["message"] = final_response
+            )) as events:
+                async for event in events:
+                    # Check for the final response
+                    if event.is_final_response() and event.content and event.content.parts:
+                        final_response = event.content.parts[0].text
+                        
+                        # Extract result from the response
+                        if "successfully completed" in final_response.lower():
+                            result["status"] = "completed"
+                        else:
+                            result["status"] = "failed"
+                        
+                        result["message"] = final_response
+                        
+                        # Nothing after the final response contributes to the result
+                        break
             
             elapsed = self.end_task_timer()
             self.log_task_completion(task_id, result["status"], elapsed, result)
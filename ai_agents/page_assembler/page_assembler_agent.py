@@ -14,8 +14,6 @@ from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 # Import base agent
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from ai_agents.shared.base_agent import BaseAgent
 
 # Import ADK components
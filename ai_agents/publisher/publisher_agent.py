@@ -15,8 +15,6 @@ from pathlib import Path
 from datetime import datetime
 
 # Import base agent
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from ai_agents.shared.base_agent import BaseAgent
 
 # Import ADK components
@@ -7,17 +7,18 @@ gathering keywords and competitive intelligence for target pages.
 """
 
 import os
-import json
+import time
 import yaml
+import orjson
 import asyncio
+import contextlib
 import logging
-from typing import Dict, Any, List, Optional
+import functools
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 
 # Import base agent
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from ai_agents.shared.base_agent import BaseAgent
 
 # Import SEO research tools
@@ -29,8 +30,70 @@ from ai_agents.seo_research.tools.content_analyzer import create_content_analysi
 from google.adk.agents import Agent
 from google.genai.types import Content, Part
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 logger = logging.getLogger(__name__)
 
+# SEO parameters configuration file
+_SEO_PARAMS_PATH = "config/seo_parameters.yaml"
+
+# Directory where per-task SEO research results are stored
+_OUTPUT_DIR = Path("data/seo_research")
+
+# Location and service data files
+_LOCATIONS_PATH = Path("data/locations/locations.json")
+_SERVICES_PATH = Path("data/services/services.json")
+
+def _write_json_atomic(path: Path, data: Dict[str, Any]) -> None:
+    """
+    Write data as JSON to a temp file and atomically move it into place.
+    
+    Args:
+        path: Destination file path
+        data: JSON-serializable data to write
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, path)
+
+@functools.lru_cache(maxsize=1)
+def _load_seo_parameters_cached() -> Dict[str, Any]:
+    """
+    Parse the SEO parameters file once per process.
+    
+    Errors propagate and are not cached, so a failed load is retried.
+    
+    Returns:
+        dict: SEO parameters
+    """
+    with open(_SEO_PARAMS_PATH, 'r') as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+def _extract_json_block(text: str) -> Optional[str]:
+    """
+    Extract the contents of the first ```json fenced block in a response.
+    
+    Args:
+        text: Model response text
+        
+    Returns:
+        str: The fenced JSON text, or None if there is no complete block
+    """
+    start = text.find('```json')
+    if start == -1:
+        return None
+    
+    start += len('```json')
+    end = text.find('```', start)
+    if end == -1:
+        return None
+    
+    return text[start:end].strip()
+
 class SeoResearchAgent(BaseAgent):
     """
     Agent responsible for SEO research and keyword analysis.
@@ -39,6 +102,13 @@ class SeoResearchAgent(BaseAgent):
     and builds a comprehensive SEO strategy for each target page.
     """
     
+    # Maps each research tool to the result key its response is stored under
+    _TOOL_RESULT_KEY = {
+        'keyword_generation_tool': 'keyword_data',
+        'serp_analysis_tool': 'serp_data',
+        'content_analysis_tool': 'content_data'
+    }
+    
     def __init__(self, config_path: str = "config/agent_config.yaml"):
         """
         Initialize the SEO Research Agent.
@@ -50,22 +120,32 @@ class SeoResearchAgent(BaseAgent):
         self.max_competitor_pages = self.agent_config.get('max_competitor_pages', 5)
         self.max_keywords_per_page = self.agent_config.get('max_keywords_per_page', 20)
         
-        # Load SEO parameters
-        self.seo_params = self._load_seo_parameters()
+        # Location/service records keyed by zip code and service ID
+        self._loc_cache: Dict[str, Dict[str, Any]] = {}
+        self._svc_cache: Dict[str, Dict[str, Any]] = {}
         
         # Create output directory
-        os.makedirs("data/seo_research", exist_ok=True)
+        _OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    
+    @property
+    def seo_params(self) -> Dict[str, Any]:
+        """
+        SEO parameters, loaded on first access and shared across instances.
+        """
+        return self._load_seo_parameters()
     
     def _load_seo_parameters(self) -> Dict[str, Any]:
         """
         Load SEO parameters from configuration.
         
+        The parsed file is cached at module level, so only the first load
+        in a process pays for the YAML parse.
+        
         Returns:
             dict: SEO parameters
         """
         try:
-            with open("config/seo_parameters.yaml", 'r') as f:
-                return yaml.safe_load(f)
+            return _load_seo_parameters_cached()
         except Exception as e:
             logger.error(f"Failed to load SEO parameters: {str(e)}")
             # Return default SEO parameters
@@ -92,15 +172,21 @@ class SeoResearchAgent(BaseAgent):
         Returns:
             dict: Location data (city, state, etc.)
         """
+        if not zip_code:
+            return {}
+        
+        if zip_code in self._loc_cache:
+            return self._loc_cache[zip_code]
+        
         try:
-            with open("data/locations/locations.json", 'r') as f:
-                locations = json.load(f)
-                
-                for location in locations:
-                    if location.get('zip') == zip_code:
-                        return location
-                
-                return {}
+            locations = orjson.loads(_LOCATIONS_PATH.read_bytes())
+            
+            for location in locations:
+                if location.get('zip') == zip_code:
+                    self._loc_cache[zip_code] = location
+                    return location
+            
+            return {}
         except Exception as e:
             self.logger.error(f"Failed to get location data for {zip_code}: {str(e)}")
             return {}
@@ -115,19 +201,64 @@ class SeoResearchAgent(BaseAgent):
         Returns:
             dict: Service data
         """
+        if not service_id:
+            return {}
+        
+        if service_id in self._svc_cache:
+            return self._svc_cache[service_id]
+        
         try:
-            with open("data/services/services.json", 'r') as f:
-                services = json.load(f)
-                
-                for service in services:
-                    if service.get('service_id') == service_id:
-                        return service
-                
-                return {}
+            services = orjson.loads(_SERVICES_PATH.read_bytes())
+            
+            for service in services:
+                if service.get('service_id') == service_id:
+                    self._svc_cache[service_id] = service
+                    return service
+            
+            return {}
         except Exception as e:
             self.logger.error(f"Failed to get service data for {service_id}: {str(e)}")
             return {}
     
+    def prefetch_context(self, tasks: List[Dict[str, Any]]) -> None:
+        """
+        Preload location and service data for a batch of tasks.
+        
+        Each data file is read once for the whole batch, so the per-task
+        lookups in process_task are served from memory.
+        
+        Args:
+            tasks: Tasks that are about to be processed
+        """
+        zip_codes = {task.get('zip') for task in tasks} - self._loc_cache.keys()
+        service_ids = {task.get('service_id') for task in tasks} - self._svc_cache.keys()
+        
+        try:
+            if zip_codes:
+                for location in orjson.loads(_LOCATIONS_PATH.read_bytes()):
+                    if location.get('zip') in zip_codes:
+                        self._loc_cache[location['zip']] = location
+            
+            if service_ids:
+                for service in orjson.loads(_SERVICES_PATH.read_bytes()):
+                    if service.get('service_id') in service_ids:
+                        self._svc_cache[service['service_id']] = service
+        except Exception as e:
+            self.logger.error(f"Failed to prefetch task context: {str(e)}")
+    
+    def _get_task_context(self, zip_code: str, service_id: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Get the location and service data for a task in a single call.
+        
+        Args:
+            zip_code: The zip code to look up
+            service_id: The service ID to look up
+            
+        Returns:
+            tuple: Location data and service data
+        """
+        return self._get_location_data(zip_code), self._get_service_data(service_id)
+    
     def initialize_agent(self):
         """
         Initialize the SEO Research Agent with necessary tools.
@@ -166,9 +297,6 @@ class SeoResearchAgent(BaseAgent):
         
         Ensure all recommendations are tailored to the specific service and location combination,
         focusing on local search intent for "near me" queries.
-        
-        Return your findings as a structured JSON object with clear sections for each aspect of the
-        SEO strategy. Include a natural language summary of your recommendations for the content team.
         """
         
         self.agent_config['instruction'] = instruction
@@ -191,12 +319,16 @@ class SeoResearchAgent(BaseAgent):
         zip_code = task.get('zip')
         
         self.logger.info(f"Processing SEO research for task {task_id}: {service_id} + {zip_code}")
-        self.start_task_timer()
+        
+        # Timed locally rather than with start_task_timer(): process_tasks runs
+        # several tasks on this instance at once, and they would share start_time
+        start = time.monotonic()
         
         try:
-            # Get additional context data
-            location_data = self._get_location_data(zip_code)
-            service_data = self._get_service_data(service_id)
+            # Get additional context data in one hop off the event loop
+            location_data, service_data = await asyncio.to_thread(
+                self._get_task_context, zip_code, service_id
+            )
             
             city = location_data.get('city', '')
             state = location_data.get('state', '')
@@ -217,7 +349,7 @@ class SeoResearchAgent(BaseAgent):
             prompt += "4. Synthesize all data into a comprehensive SEO strategy\n\n"
             
             # Add format instructions
-            prompt += "Return your findings as a JSON object with these sections:\n"
+            prompt += "Return your findings as a single raw JSON object, without markdown code fences, with these sections:\n"
             prompt += "- keywords: Primary, secondary, and long-tail keywords\n"
             prompt += "- serp_insights: Insights from search results analysis\n"
             prompt += "- content_strategy: Recommendations for content structure\n"
@@ -242,67 +374,70 @@ class SeoResearchAgent(BaseAgent):
                     "city": city,
                     "state": state
                 },
-                "timestamp": datetime.now().isoformat()
+                "timestamp": datetime.now(timezone.utc).isoformat(timespec='seconds')
             }
             
+            # Text of the final response, parsed once the event stream is done
+            response_text = None
+            
             # Process the task using the SEO Research Agent
-            async for event in self.runner.run_async(
+            async with contextlib.aclosing(self.runner.run_async(
                 user_id=user_id,
                 session_id=session_id,
                 new_message=content
-            ):
-                # Process function calls (tool usage)
-                function_calls = event.get_function_calls()
-                if function_calls:
-                    # Log tool usage for debugging
-                    for function_call in function_calls:
-                        self.logger.info(f"Tool call: {function_call.name} with args: {function_call.args}")
-                
-                # Process function responses (tool results)
-                function_responses = event.get_function_responses()
-                if function_responses:
-                    # Record tool results for output
-                    for function_response in function_responses:
-                        tool_name = function_response.function_call_id.split('/')[-1]
-                        if 'keyword' in tool_name.lower():
-                            result["keyword_data"] = function_response.response
-                        elif 'serp' in tool_name.lower():
-                            result["serp_data"] = function_response.response
-                        elif 'content' in tool_name.lower():
-                            result["content_data"] = function_response.response
-                
-                # Check for the final response
-                if event.is_final_response() and event.content and event.content.parts:
-                    # Try to parse the structured data from the response
-                    response_text = event.content.parts[0].text
-                    try:
-                        # Extract JSON data if present
-                        import re
-                        json_match = re.search(r'```json\n(.+?)\n```', response_text, re.DOTALL)
+            )) as events:
+                async for event in events:
+                    # Process function calls (tool usage)
+                    function_calls = event.get_function_calls()
+                    if function_calls:
+                        # Log tool usage for debugging
+                        for function_call in function_calls:
+                            self.logger.info(f"Tool call: {function_call.name} with args: {function_call.args}")
+                    
+                    # Process function responses (tool results)
+                    function_responses = event.get_function_responses()
+                    if function_responses:
+                        # Record tool results for output
+                        for function_response in function_responses:
+                            result_key = self._TOOL_RESULT_KEY.get(function_response.name)
+                            if result_key:
+                                result[result_key] = function_response.response
+                    
+                    # Capture the final response and stop; nothing after it contributes
+                    if event.is_final_response() and event.content and event.content.parts:
+                        response_text = event.content.parts[0].text
+                        break
+            
+            # Try to parse the structured data from the final response
+            if response_text is not None:
+                try:
+                    # The prompt asks for bare JSON; fall back to a fenced block
+                    if response_text.lstrip().startswith('{'):
+                        result["seo_strategy"] = orjson.loads(response_text)
+                    else:
+                        json_block = _extract_json_block(response_text)
                         
-                        if json_match:
-                            seo_data = json.loads(json_match.group(1))
+                        if json_block is not None:
+                            seo_data = orjson.loads(json_block)
                             result["seo_strategy"] = seo_data
                         else:
                             # Process unstructured text response
                             result["seo_recommendations"] = response_text
-                    except Exception as e:
-                        self.logger.error(f"Failed to parse SEO results: {str(e)}")
-                        result["seo_recommendations"] = response_text
+                except Exception as e:
+                    self.logger.error(f"Failed to parse SEO results: {str(e)}")
+                    result["seo_recommendations"] = response_text
             
-            elapsed = self.end_task_timer()
+            elapsed = time.monotonic() - start
             self.log_task_completion(task_id, "completed", elapsed, result)
             
             # Save the SEO research results
-            output_dir = f"data/seo_research"
-            os.makedirs(output_dir, exist_ok=True)
-            with open(f"{output_dir}/{task_id}.json", 'w') as f:
-                json.dump(result, f, indent=2)
+            output_path = _OUTPUT_DIR / f"{task_id}.json"
+            await asyncio.to_thread(_write_json_atomic, output_path, result)
             
             return result
             
         except Exception as e:
-            elapsed = self.end_task_timer()
+            elapsed = time.monotonic() - start
             self.logger.error(f"Error processing SEO research for task {task_id}: {str(e)}")
             
             result = {
@@ -314,3 +449,23 @@ class SeoResearchAgent(BaseAgent):
             
             self.log_task_completion(task_id, "error", elapsed, result)
             return result
+    
+    async def process_tasks(self, tasks: List[Dict[str, Any]], concurrency: int = 8) -> List[Dict[str, Any]]:
+        """
+        Process a batch of SEO research tasks concurrently.
+        
+        Args:
+            tasks: The tasks to process
+            concurrency: Maximum number of tasks processed at once
+            
+        Returns:
+            list: SEO research results, in the same order as the tasks
+        """
+        await asyncio.to_thread(self.prefetch_context, tasks)
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def run_task(task: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.process_task(task)
+        
+        return await asyncio.gather(*(run_task(task) for task in tasks))
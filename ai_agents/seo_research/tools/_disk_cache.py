@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+JSON disk cache shared by the SEO Research Agent tools.
+
+Each entry is stored as one JSON file per key in a cache directory. An in-process
+dict of serialized entries sits in front of the files, and writes are batched and
+flushed to disk at most once per flush interval (and at interpreter exit).
+"""
+
+import os
+import time
+import atexit
+import logging
+import orjson
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+class JsonDiskCache:
+    """
+    Write-behind JSON file cache with an in-memory front.
+    """
+    
+    def __init__(self, cache_dir: str, flush_interval_s: float = 5.0):
+        """
+        Initialize the cache.
+        
+        Args:
+            cache_dir: Directory holding one JSON file per cache key
+            flush_interval_s: Minimum seconds between cache flushes to disk
+        """
+        self.cache_dir = cache_dir
+        self.flush_interval_s = flush_interval_s
+        # Entries are held as serialized JSON, so every get() hands out a fresh
+        # copy and callers mutating a result can't change what others see
+        self._mem_cache: Dict[str, bytes] = {}
+        self._dirty: Dict[str, bytes] = {}
+        self._last_flush = time.monotonic()
+        
+        os.makedirs(cache_dir, exist_ok=True)
+        
+        # One directory sweep at startup so lookups for keys that were never
+        # written skip the filesystem entirely. Entries written by other
+        # processes after this point are not seen until the next start.
+        with os.scandir(cache_dir) as entries:
+            self._known_keys = {entry.name[:-5] for entry in entries if entry.name.endswith(".json")}
+        
+        atexit.register(self.flush)
+    
+    @staticmethod
+    def make_key(*parts: Optional[str]) -> str:
+        """
+        Build a cache key from the given parts, skipping empty ones.
+        
+        Args:
+            *parts: Key components (e.g. service, location)
+        
+        Returns:
+            str: Cache key
+        """
+        return "_".join(part.lower().replace(" ", "_") for part in parts if part)
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached value, falling back to disk on a memory miss.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            dict: A copy of the cached value if available, None otherwise
+        """
+        # Includes values still waiting to be flushed to disk
+        data = self._mem_cache.get(key)
+        if data is not None:
+            return orjson.loads(data)
+        if key not in self._known_keys:
+            return None
+        
+        try:
+            with open(self._path(key), 'rb') as f:
+                data = f.read()
+            value = orjson.loads(data)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Error reading cache for {key}: {str(e)}")
+            return None
+        
+        self._mem_cache[key] = data
+        return value
+    
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store a value and flush pending values to disk if the flush interval
+        has elapsed.
+        
+        The value is serialized immediately, so later changes to it by the
+        caller are not reflected in the cache.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        try:
+            data = orjson.dumps(value)
+        except Exception as e:
+            logger.error(f"Error caching results for {key}: {str(e)}")
+            return
+        
+        self._mem_cache[key] = data
+        self._dirty[key] = data
+        if time.monotonic() - self._last_flush >= self.flush_interval_s:
+            self.flush()
+    
+    def flush(self) -> None:
+        """
+        Write all pending cache entries to disk in one pass.
+        """
+        pending, self._dirty = self._dirty, {}
+        self._last_flush = time.monotonic()
+        
+        for key, data in pending.items():
+            try:
+                with open(self._path(key), 'wb') as f:
+                    f.write(data)
+                self._known_keys.add(key)
+            except Exception as e:
+                logger.error(f"Error caching results for {key}: {str(e)}")
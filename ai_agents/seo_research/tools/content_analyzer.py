@@ -7,15 +7,79 @@ to identify patterns, structures, and elements that contribute to high rankings.
 """
 
 import os
-import json
+import time
+import hashlib
 import logging
 import random
+import orjson
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Static reference data for simulated analyses, built once at import time
+_IMAGE_TYPES = (
+    "service_photos",
+    "team_photos",
+    "before_after_comparisons",
+    "infographics",
+    "service_area_maps",
+    "testimonial_photos",
+    "certification_logos"
+)
+
+_IMAGE_ATTRIBUTES = (
+    "descriptive_filenames",
+    "alt_text_with_keywords",
+    "compressed_file_size",
+    "responsive_sizing"
+)
+
+_SCHEMA_TYPES = (
+    "LocalBusiness",
+    "Service",
+    "FAQPage",
+    "Review",
+    "Offer"
+)
+
+_SCHEMA_PROPERTIES = (
+    "name",
+    "description",
+    "address",
+    "priceRange",
+    "telephone",
+    "serviceArea",
+    "openingHours"
+)
+
+_LOCATION_SPECIFIC_CONTENT = (
+    "service area map",
+    "local testimonials",
+    "location-specific problems addressed",
+    "local regulations mentioned"
+)
+
+_GENERAL_RECOMMENDATIONS = (
+    "Expand FAQ section with common customer questions",
+    "Add more visual elements to break up text",
+    "Include specific pricing information where possible",
+    "Add customer testimonials with full names and locations",
+    "Enhance schema markup with more detailed properties",
+    "Improve local relevance by mentioning nearby areas served"
+)
+
+_MOBILE_TECHNIQUES = (
+    "responsive design",
+    "fast loading times",
+    "simplified navigation",
+    "click-to-call buttons",
+    "mobile-friendly forms"
+)
+
 class ContentAnalyzer:
     """
     Tool for analyzing competitor content for SEO insights.
@@ -25,15 +89,31 @@ class ContentAnalyzer:
     use simulated data for demonstration purposes.
     """
     
-    def __init__(self, cache_dir: str = "data/seo_research/content_cache"):
+    def __init__(self, cache_dir: str = "data/seo_research/content_cache",
+                 simulate_latency_s: float = 0.0, mem_cache_size: int = 512):
         """
         Initialize the Content Analyzer.
         
         Args:
             cache_dir: Directory for caching content analysis results
+            simulate_latency_s: Seconds to sleep per uncached analysis to mimic
+                a real scraping API (disabled by default)
+            mem_cache_size: Maximum number of results kept in memory; the least
+                recently used result is evicted first
         """
         self.cache_dir = cache_dir
+        self.simulate_latency_s = simulate_latency_s
+        self.mem_cache_size = mem_cache_size
+        # Results are held as serialized JSON, so every hit decodes a fresh copy
+        # and callers mutating a result can't change what later callers see
+        self._mem_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        
+        # Single background writer so disk cache writes stay off the request path
+        self._cache_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="content_cache")
         os.makedirs(cache_dir, exist_ok=True)
+        
+        # Shard directories already created; only touched by the writer thread
+        self._shard_dirs: set = set()
     
     def analyze_competitor_content(self, urls: List[str], service: str, 
                                  location: Optional[str] = None) -> Dict[str, Any]:
@@ -60,9 +140,9 @@ class ContentAnalyzer:
         # For demonstration, generate simulated analysis
         logger.info(f"Analyzing competitor content for {service} in {location}")
         
-        # Simulate API call latency
-        import time
-        time.sleep(0.5)
+        # Simulate API call latency only when explicitly requested
+        if self.simulate_latency_s:
+            time.sleep(self.simulate_latency_s)
         
         # Generate simulated content analysis
         results = self._generate_simulated_analysis(urls, service, location)
@@ -83,9 +163,25 @@ class ContentAnalyzer:
         Returns:
             str: Cache key
         """
-        service_normalized = service.lower().replace(" ", "_")
-        location_part = f"_{location.lower().replace(' ', '_')}" if location else ""
-        return f"content_{service_normalized}{location_part}"
+        raw_key = f"{service.lower()}|{location.lower() if location else ''}"
+        digest = hashlib.blake2b(raw_key.encode(), digest_size=8).hexdigest()
+        return f"content_{digest}"
+    
+    def _cache_path(self, cache_key: str) -> str:
+        """
+        Get the disk cache path for a key.
+        
+        Files are sharded into two levels of subdirectories named after the
+        leading hex digits of the key's digest, keeping directories small.
+        
+        Args:
+            cache_key: Cache key
+            
+        Returns:
+            str: Cache file path
+        """
+        digest = cache_key[len("content_"):]
+        return os.path.join(self.cache_dir, digest[:2], digest[2:4], f"{cache_key}.json")
     
     def _check_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """
@@ -95,17 +191,40 @@ class ContentAnalyzer:
             cache_key: Cache key
             
         Returns:
-            dict: Cached results if available, None otherwise
+            dict: A copy of the cached results if available, None otherwise
+        """
+        payload = self._mem_cache.get(cache_key)
+        if payload is not None:
+            self._mem_cache.move_to_end(cache_key)
+            return orjson.loads(payload)
+        
+        cache_path = self._cache_path(cache_key)
+        try:
+            with open(cache_path, 'rb') as f:
+                payload = f.read()
+            results = orjson.loads(payload)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Error reading cache for {cache_key}: {str(e)}")
+            return None
+        
+        self._remember(cache_key, payload)
+        return results
+    
+    def _remember(self, cache_key: str, payload: bytes) -> None:
         """
-        cache_path = os.path.join(self.cache_dir, f"{cache_key}.json")
-        if os.path.exists(cache_path):
-            try:
-                with open(cache_path, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.error(f"Error reading cache for {cache_key}: {str(e)}")
-        
-        return None
+        Add serialized results to the in-memory LRU cache, evicting the oldest
+        entry if full.
+        
+        Args:
+            cache_key: Cache key
+            payload: Serialized results
+        """
+        self._mem_cache[cache_key] = payload
+        self._mem_cache.move_to_end(cache_key)
+        if len(self._mem_cache) > self.mem_cache_size:
+            self._mem_cache.popitem(last=False)
     
     def _cache_results(self, cache_key: str, results: Dict[str, Any]) -> None:
         """
@@ -115,10 +234,33 @@ class ContentAnalyzer:
             cache_key: Cache key
             results: Results to cache
         """
-        cache_path = os.path.join(self.cache_dir, f"{cache_key}.json")
         try:
-            with open(cache_path, 'w') as f:
-                json.dump(results, f, indent=2)
+            # Snapshot now; memory and disk both keep this payload, so later
+            # mutations of results by the caller don't leak into either cache
+            payload = orjson.dumps(results)
+        except Exception as e:
+            logger.error(f"Error caching results for {cache_key}: {str(e)}")
+            return
+        
+        self._remember(cache_key, payload)
+        self._cache_writer.submit(self._write_cache_file, cache_key, payload)
+    
+    def _write_cache_file(self, cache_key: str, payload: bytes) -> None:
+        """
+        Write serialized results to the disk cache.
+        
+        Args:
+            cache_key: Cache key
+            payload: Serialized results
+        """
+        cache_path = self._cache_path(cache_key)
+        shard_dir = os.path.dirname(cache_path)
+        try:
+            if shard_dir not in self._shard_dirs:
+                os.makedirs(shard_dir, exist_ok=True)
+                self._shard_dirs.add(shard_dir)
+            with open(cache_path, 'wb') as f:
+                f.write(payload)
         except Exception as e:
             logger.error(f"Error caching results for {cache_key}: {str(e)}")
     
@@ -135,22 +277,6 @@ class ContentAnalyzer:
         Returns:
             dict: Simulated content analysis
         """
-        # Common page sections for service pages
-        section_types = [
-            "hero_banner",
-            "service_description",
-            "service_benefits",
-            "service_areas",
-            "pricing_info",
-            "testimonials",
-            "portfolio",
-            "licensing_info",
-            "contact_section",
-            "guarantee_section",
-            "faq_section",
-            "call_to_action"
-        ]
-        
         # Section frequencies (simulating % of top pages that include this section)
         section_frequencies = {
             "hero_banner": random.randint(85, 100),
@@ -174,23 +300,20 @@ class ContentAnalyzer:
             reverse=True
         )
         
-        # Heading structures used
-        heading_structures = [
-            {
-                "h1_count": 1,
-                "h2_count": random.randint(3, 7),
-                "h3_count": random.randint(5, 12),
-                "h4_count": random.randint(0, 5)
-            }
-            for _ in range(len(urls))
-        ]
+        # Heading counts used per page, summed in a single pass
+        page_count = max(len(urls), 1)
+        h2_total = h3_total = h4_total = 0
+        for _ in range(page_count):
+            h2_total += random.randint(3, 7)
+            h3_total += random.randint(5, 12)
+            h4_total += random.randint(0, 5)
         
         # Average heading counts
         avg_heading_structure = {
             "h1_count": 1,  # Always 1 H1
-            "h2_count": sum(h["h2_count"] for h in heading_structures) // len(heading_structures),
-            "h3_count": sum(h["h3_count"] for h in heading_structures) // len(heading_structures),
-            "h4_count": sum(h["h4_count"] for h in heading_structures) // len(heading_structures)
+            "h2_count": h2_total // page_count,
+            "h3_count": h3_total // page_count,
+            "h4_count": h4_total // page_count
         }
         
         # Common heading patterns
@@ -223,41 +346,14 @@ class ContentAnalyzer:
         # Image usage statistics
         image_usage = {
             "avg_images_per_page": random.randint(4, 10),
-            "image_types": [
-                "service_photos",
-                "team_photos",
-                "before_after_comparisons",
-                "infographics",
-                "service_area_maps",
-                "testimonial_photos",
-                "certification_logos"
-            ],
-            "important_image_attributes": [
-                "descriptive_filenames",
-                "alt_text_with_keywords",
-                "compressed_file_size",
-                "responsive_sizing"
-            ]
+            "image_types": list(_IMAGE_TYPES),
+            "important_image_attributes": list(_IMAGE_ATTRIBUTES)
         }
         
         # Schema markup usage
         schema_markup = {
-            "types_used": [
-                "LocalBusiness",
-                "Service",
-                "FAQPage",
-                "Review",
-                "Offer"
-            ],
-            "important_properties": [
-                "name",
-                "description",
-                "address",
-                "priceRange",
-                "telephone",
-                "serviceArea",
-                "openingHours"
-            ]
+            "types_used": list(_SCHEMA_TYPES),
+            "important_properties": list(_SCHEMA_PROPERTIES)
         }
         
         # Local relevance signals
@@ -266,35 +362,19 @@ class ContentAnalyzer:
             "nearby_locations_mentioned": random.randint(3, 8) if location else 0,
             "local_landmarks_referenced": random.randint(1, 5) if location else 0,
             "local_events_mentioned": random.randint(0, 3) if location else 0,
-            "location_specific_content": [
-                "service area map",
-                "local testimonials",
-                "location-specific problems addressed",
-                "local regulations mentioned"
-            ] if location else []
+            "location_specific_content": list(_LOCATION_SPECIFIC_CONTENT) if location else []
         }
         
         # Recommended content improvements
         improvement_recommendations = [
             "Include more location-specific content" if location else "Add more service-specific details",
-            "Expand FAQ section with common customer questions",
-            "Add more visual elements to break up text",
-            "Include specific pricing information where possible",
-            "Add customer testimonials with full names and locations",
-            "Enhance schema markup with more detailed properties",
-            "Improve local relevance by mentioning nearby areas served"
+            *_GENERAL_RECOMMENDATIONS
         ]
         
         # Mobile optimization characteristics
         mobile_optimization = {
             "importance": "critical",
-            "common_techniques": [
-                "responsive design",
-                "fast loading times",
-                "simplified navigation",
-                "click-to-call buttons",
-                "mobile-friendly forms"
-            ]
+            "common_techniques": list(_MOBILE_TECHNIQUES)
         }
         
         return {
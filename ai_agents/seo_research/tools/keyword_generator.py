@@ -6,13 +6,13 @@ This module provides tools for generating keyword sets for target services
 and locations, including primary, secondary, and long-tail variations.
 """
 
-import os
-import json
 import logging
-import random
-from typing import Dict, Any, List, Optional
+import itertools
+from typing import Dict, Any, List, Optional, Tuple, Iterable
 from pathlib import Path
 
+from ai_agents.seo_research.tools._disk_cache import JsonDiskCache
+
 logger = logging.getLogger(__name__)
 
 class KeywordGenerator:
@@ -24,31 +24,151 @@ class KeywordGenerator:
     algorithmic generation and templates for demonstration purposes.
     """
     
-    def __init__(self, keywords_dir: str = "data/seo_research/keywords"):
+    # Search intent patterns and keyword modifiers, shared by all instances
+    _INTENTS: Dict[str, Tuple[str, ...]] = {
+        "informational": ("how to", "what is", "ways to", "guide", "tips for"),
+        "navigational": ("near me", "in {location}", "local", "nearby", "{location}"),
+        "transactional": ("hire", "cost", "price", "quotes", "estimate", "book", "service"),
+        "commercial": ("best", "top", "reviews", "compare", "vs", "versus")
+    }
+    _MODIFIERS: Dict[str, Tuple[str, ...]] = {
+        "quality": ("professional", "expert", "licensed", "certified", "experienced", "reliable", "trusted"),
+        "price": ("affordable", "cheap", "low cost", "budget", "expensive", "premium", "luxury"),
+        "time": ("24/7", "emergency", "same day", "fast", "quick", "immediate", "urgent"),
+        "service": ("service", "company", "contractor", "specialist", "pro", "technician", "expert")
+    }
+    
+    # Common problems/needs used for service-specific long-tail keywords
+    _SERVICE_PROBLEMS: Dict[str, Tuple[str, ...]] = {
+        "plumber": ("clogged drain", "leaky faucet", "water heater", "toilet repair"),
+        "electrician": ("power outage", "wiring installation", "ceiling fan", "outlet repair")
+    }
+    
+    # Service-specific related terms
+    _RELATED_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+        "plumber": ("plumbing", "plumbing services", "water leak", "drain cleaning",
+                    "pipe repair", "water heater installation", "bathroom plumbing"),
+        "electrician": ("electrical services", "wiring", "electrical repair",
+                        "circuit breaker", "lighting installation", "outlet installation"),
+        "hvac": ("air conditioning", "heating", "furnace repair",
+                 "ac installation", "duct cleaning", "heat pump"),
+        "roofer": ("roof repair", "roofing", "roof replacement",
+                   "shingle repair", "roof inspection", "roof leak")
+    }
+    
+    def __init__(self, keywords_dir: str = "data/seo_research/keywords",
+                 flush_interval_s: float = 5.0):
         """
         Initialize the Keyword Generator.
         
         Args:
             keywords_dir: Directory for storing keyword data
+            flush_interval_s: Minimum seconds between cache flushes to disk
         """
         self.keywords_dir = keywords_dir
-        self.intents = {
-            "informational": ["how to", "what is", "ways to", "guide", "tips for"],
-            "navigational": ["near me", "in {location}", "local", "nearby", "{location}"],
-            "transactional": ["hire", "cost", "price", "quotes", "estimate", "book", "service"],
-            "commercial": ["best", "top", "reviews", "compare", "vs", "versus"]
-        }
-        self.modifiers = {
-            "quality": ["professional", "expert", "licensed", "certified", "experienced", "reliable", "trusted"],
-            "price": ["affordable", "cheap", "low cost", "budget", "expensive", "premium", "luxury"],
-            "time": ["24/7", "emergency", "same day", "fast", "quick", "immediate", "urgent"],
-            "service": ["service", "company", "contractor", "specialist", "pro", "technician", "expert"]
-        }
-        
-        os.makedirs(keywords_dir, exist_ok=True)
+        self._cache = JsonDiskCache(keywords_dir, flush_interval_s)
+        
+        # The modifier and intent pools are static, so the keyword patterns built
+        # from them are expanded once here; each request only fills in the service
+        # and location. Using a fixed subset of each pool keeps output deterministic,
+        # which lets the disk cache hit across runs.
+        self._secondary_loc, self._secondary_no_loc = self._build_secondary_templates()
+        self._longtail_loc, self._longtail_no_loc = self._build_long_tail_templates()
+        self._intent_dispatch = self._build_intent_dispatch()
+    
+    def _build_secondary_templates(self) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Build secondary keyword templates with and without a location.
+        
+        Returns:
+            tuple: (templates with location, templates without location)
+        """
+        qualities = self._MODIFIERS["quality"][:3]
+        services = self._MODIFIERS["service"][:3]
+        
+        with_loc = [
+            template
+            for quality in qualities
+            for template in (f"{quality} {{service}} in {{location}}", f"{quality} {{service}} {{location}}")
+        ] + [
+            template
+            for svc in services
+            for template in (f"{{service}} {svc} in {{location}}", f"{{service}} {svc} {{location}}")
+        ]
+        without_loc = [
+            template
+            for quality in qualities
+            for template in (f"{quality} {{service}}", f"{quality} {{service}} services")
+        ] + [
+            template
+            for svc in services
+            for template in (f"{{service}} {svc}", f"{{service}} {svc} near me")
+        ]
+        
+        return tuple(with_loc), tuple(without_loc)
+    
+    def _build_long_tail_templates(self) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Build long-tail keyword templates with and without a location.
+        
+        Returns:
+            tuple: (templates with location, templates without location)
+        """
+        time_quality = list(itertools.product(self._MODIFIERS["time"][:2], self._MODIFIERS["quality"][:2]))
+        price_service = list(itertools.product(self._MODIFIERS["price"][:2], self._MODIFIERS["service"][:2]))
+        
+        # Time + Quality + Service + Location
+        with_loc = [f"{timing} {quality} {{service}} in {{location}}" for timing, quality in time_quality]
+        without_loc = [f"{timing} {quality} {{service}} near me" for timing, quality in time_quality]
+        
+        # Price + Service + Location
+        with_loc += [f"{price} {{service}} {svc} in {{location}}" for price, svc in price_service]
+        without_loc += [f"{price} {{service}} {svc} near me" for price, svc in price_service]
+        
+        # Informational intent + Service + Location
+        for info in self._INTENTS["informational"][:2]:
+            if info == "how to" or info == "what is":
+                # These need different sentence structure
+                with_loc += [f"{info} find {{service}} in {{location}}", f"{info} choose {{service}} in {{location}}"]
+                without_loc += [f"{info} find good {{service}}", f"{info} choose right {{service}}"]
+            else:
+                with_loc.append(f"{info} {{service}} in {{location}}")
+                without_loc.append(f"{info} {{service}}")
+        
+        # Commercial intent
+        with_loc += [f"{comm} {{service}} in {{location}}" for comm in self._INTENTS["commercial"][:2]]
+        without_loc += [f"{comm} {{service}} companies" for comm in self._INTENTS["commercial"][:2]]
+        
+        return tuple(with_loc), tuple(without_loc)
+    
+    def _build_intent_dispatch(self) -> Dict[str, Tuple[Tuple[str, str], ...]]:
+        """
+        Classify each intent pattern once so keyword generation is a table lookup.
+        
+        Kinds are "in_loc" ("in {location}"), "loc_only" ("{location}"),
+        "question" (patterns that need "find" before the service) and "plain".
+        
+        Returns:
+            dict: (kind, text) pairs per intent
+        """
+        dispatch = {}
+        for intent, patterns in self._INTENTS.items():
+            entries = []
+            for pattern in patterns:
+                if pattern == "in {location}":
+                    entries.append(("in_loc", "in"))
+                elif pattern == "{location}":
+                    entries.append(("loc_only", ""))
+                elif pattern in ("how to", "what is", "ways to"):
+                    entries.append(("question", pattern))
+                else:
+                    entries.append(("plain", pattern))
+            dispatch[intent] = tuple(entries)
+        return dispatch
     
     def generate_keywords(self, service: str, location: Optional[str] = None, 
-                         include_serp_data: bool = True) -> Dict[str, Any]:
+                         include_serp_data: bool = True,
+                         categories: Optional[Iterable[str]] = None) -> Dict[str, Any]:
         """
         Generate keyword sets for a given service and location.
         
@@ -56,13 +176,19 @@ class KeywordGenerator:
             service: Service type (e.g., "plumber")
             location: Optional location specifier (e.g., "New York" or "33442")
             include_serp_data: Whether to incorporate SERP analysis data
+            categories: Optional keyword sets to generate, any of "primary",
+                "secondary", "long_tail", "related" and "intent"; all sets are
+                generated when omitted. Partial results are not cached, but a
+                cached full result is returned as-is.
             
         Returns:
             dict: Generated keyword sets
         """
+        wanted = set(categories) if categories else None
+        
         # Check for cached results
-        cache_key = self._generate_cache_key(service, location)
-        cached_result = self._check_cache(cache_key)
+        cache_key = self._cache.make_key(service, location)
+        cached_result = self._cache.get(cache_key)
         
         if cached_result:
             logger.info(f"Using cached keywords for {service} in {location}")
@@ -71,82 +197,27 @@ class KeywordGenerator:
         logger.info(f"Generating keywords for {service} in {location}")
         
         # Generate keyword sets
-        primary_keywords = self._generate_primary_keywords(service, location)
-        secondary_keywords = self._generate_secondary_keywords(service, location)
-        long_tail_keywords = self._generate_long_tail_keywords(service, location)
-        related_keywords = self._generate_related_keywords(service)
-        
-        # Organize results
-        results = {
-            "service": service,
-            "location": location,
-            "primary_keywords": primary_keywords,
-            "secondary_keywords": secondary_keywords,
-            "long_tail_keywords": long_tail_keywords,
-            "related_keywords": related_keywords,
-            "keyword_categories": {
-                "informational": self._generate_intent_keywords(service, location, "informational"),
-                "navigational": self._generate_intent_keywords(service, location, "navigational"),
-                "transactional": self._generate_intent_keywords(service, location, "transactional"),
-                "commercial": self._generate_intent_keywords(service, location, "commercial")
+        results = {"service": service, "location": location}
+        if not wanted or "primary" in wanted:
+            results["primary_keywords"] = self._generate_primary_keywords(service, location)
+        if not wanted or "secondary" in wanted:
+            results["secondary_keywords"] = self._generate_secondary_keywords(service, location)
+        if not wanted or "long_tail" in wanted:
+            results["long_tail_keywords"] = self._generate_long_tail_keywords(service, location)
+        if not wanted or "related" in wanted:
+            results["related_keywords"] = self._generate_related_keywords(service)
+        if not wanted or "intent" in wanted:
+            results["keyword_categories"] = {
+                intent: self._generate_intent_keywords(service, location, intent)
+                for intent in self._INTENTS
             }
-        }
         
         # Cache the results
-        self._cache_results(cache_key, results)
+        if not wanted:
+            self._cache.put(cache_key, results)
         
         return results
     
-    def _generate_cache_key(self, service: str, location: Optional[str]) -> str:
-        """
-        Generate a cache key for the given parameters.
-        
-        Args:
-            service: Service type
-            location: Location specifier
-            
-        Returns:
-            str: Cache key
-        """
-        service_normalized = service.lower().replace(" ", "_")
-        location_part = f"_{location.lower().replace(' ', '_')}" if location else ""
-        return f"{service_normalized}{location_part}"
-    
-    def _check_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
-        """
-        Check if results are cached for the given key.
-        
-        Args:
-            cache_key: Cache key
-            
-        Returns:
-            dict: Cached results if available, None otherwise
-        """
-        cache_path = os.path.join(self.keywords_dir, f"{cache_key}.json")
-        if os.path.exists(cache_path):
-            try:
-                with open(cache_path, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.error(f"Error reading cache for {cache_key}: {str(e)}")
-        
-        return None
-    
-    def _cache_results(self, cache_key: str, results: Dict[str, Any]) -> None:
-        """
-        Cache results for the given key.
-        
-        Args:
-            cache_key: Cache key
-            results: Results to cache
-        """
-        cache_path = os.path.join(self.keywords_dir, f"{cache_key}.json")
-        try:
-            with open(cache_path, 'w') as f:
-                json.dump(results, f, indent=2)
-        except Exception as e:
-            logger.error(f"Error caching results for {cache_key}: {str(e)}")
-    
     def _generate_primary_keywords(self, service: str, location: Optional[str]) -> List[str]:
         """
         Generate primary keyword variations.
@@ -187,30 +258,9 @@ class KeywordGenerator:
         Returns:
             list: Secondary keywords
         """
-        # Use quality and service modifiers for secondary keywords
-        quality_mods = self.modifiers["quality"]
-        service_mods = self.modifiers["service"]
-        
-        secondary = []
-        
-        # Create combinations
-        for quality in random.sample(quality_mods, k=min(3, len(quality_mods))):
-            if location:
-                secondary.append(f"{quality} {service} in {location}")
-                secondary.append(f"{quality} {service} {location}")
-            else:
-                secondary.append(f"{quality} {service}")
-                secondary.append(f"{quality} {service} services")
-        
-        for svc in random.sample(service_mods, k=min(3, len(service_mods))):
-            if location:
-                secondary.append(f"{service} {svc} in {location}")
-                secondary.append(f"{service} {svc} {location}")
-            else:
-                secondary.append(f"{service} {svc}")
-                secondary.append(f"{service} {svc} near me")
-        
-        return secondary
+        if location:
+            return [t.format(service=service, location=location) for t in self._secondary_loc]
+        return [t.format(service=service) for t in self._secondary_no_loc]
     
     def _generate_long_tail_keywords(self, service: str, location: Optional[str]) -> List[str]:
         """
@@ -223,63 +273,14 @@ class KeywordGenerator:
         Returns:
             list: Long-tail keywords
         """
-        # Use more specific patterns for long-tail keywords
-        long_tail = []
-        
-        # Time + Quality + Service + Location
-        for time in random.sample(self.modifiers["time"], k=min(2, len(self.modifiers["time"]))):
-            for quality in random.sample(self.modifiers["quality"], k=min(2, len(self.modifiers["quality"]))):
-                if location:
-                    long_tail.append(f"{time} {quality} {service} in {location}")
-                else:
-                    long_tail.append(f"{time} {quality} {service} near me")
-        
-        # Price + Service + Location
-        for price in random.sample(self.modifiers["price"], k=min(2, len(self.modifiers["price"]))):
-            for svc in random.sample(self.modifiers["service"], k=min(2, len(self.modifiers["service"]))):
-                if location:
-                    long_tail.append(f"{price} {service} {svc} in {location}")
-                else:
-                    long_tail.append(f"{price} {service} {svc} near me")
-        
-        # Informational intent + Service + Location
-        for info in random.sample(self.intents["informational"], k=min(2, len(self.intents["informational"]))):
-            if info == "how to" or info == "what is":
-                # These need different sentence structure
-                if location:
-                    long_tail.append(f"{info} find {service} in {location}")
-                    long_tail.append(f"{info} choose {service} in {location}")
-                else:
-                    long_tail.append(f"{info} find good {service}")
-                    long_tail.append(f"{info} choose right {service}")
-            else:
-                if location:
-                    long_tail.append(f"{info} {service} in {location}")
-                else:
-                    long_tail.append(f"{info} {service}")
-        
-        # Commercial intent
-        for comm in random.sample(self.intents["commercial"], k=min(2, len(self.intents["commercial"]))):
-            if location:
-                long_tail.append(f"{comm} {service} in {location}")
-            else:
-                long_tail.append(f"{comm} {service} companies")
+        if location:
+            long_tail = [t.format(service=service, location=location) for t in self._longtail_loc]
+        else:
+            long_tail = [t.format(service=service) for t in self._longtail_no_loc]
         
         # Service-specific variations based on common problems/needs
-        if service.lower() == "plumber":
-            problems = ["clogged drain", "leaky faucet", "water heater", "toilet repair"]
-            for problem in problems:
-                if location:
-                    long_tail.append(f"{problem} {service} in {location}")
-                else:
-                    long_tail.append(f"{problem} {service} near me")
-        elif service.lower() == "electrician":
-            problems = ["power outage", "wiring installation", "ceiling fan", "outlet repair"]
-            for problem in problems:
-                if location:
-                    long_tail.append(f"{problem} {service} in {location}")
-                else:
-                    long_tail.append(f"{problem} {service} near me")
+        problem_suffix = f"in {location}" if location else "near me"
+        long_tail += [f"{problem} {service} {problem_suffix}" for problem in self._SERVICE_PROBLEMS.get(service.lower(), ())]
         
         return long_tail
     
@@ -293,32 +294,18 @@ class KeywordGenerator:
         Returns:
             list: Related keywords
         """
-        # Service-specific related terms
-        related = []
-        
-        if service.lower() == "plumber":
-            related = ["plumbing", "plumbing services", "water leak", "drain cleaning", 
-                      "pipe repair", "water heater installation", "bathroom plumbing"]
-        elif service.lower() == "electrician":
-            related = ["electrical services", "wiring", "electrical repair", 
-                      "circuit breaker", "lighting installation", "outlet installation"]
-        elif service.lower() == "hvac":
-            related = ["air conditioning", "heating", "furnace repair", 
-                      "ac installation", "duct cleaning", "heat pump"]
-        elif service.lower() == "roofer":
-            related = ["roof repair", "roofing", "roof replacement", 
-                      "shingle repair", "roof inspection", "roof leak"]
-        else:
-            # Generic related terms
-            related = [
-                f"{service} repair", 
-                f"{service} installation", 
-                f"{service} maintenance", 
-                f"{service} company", 
-                f"{service} contractor"
-            ]
-        
-        return related
+        related = self._RELATED_KEYWORDS.get(service.lower())
+        if related:
+            return list(related)
+        
+        # Generic related terms
+        return [
+            f"{service} repair", 
+            f"{service} installation", 
+            f"{service} maintenance", 
+            f"{service} company", 
+            f"{service} contractor"
+        ]
     
     def _generate_intent_keywords(self, service: str, location: Optional[str], intent: str) -> List[str]:
         """
@@ -332,22 +319,19 @@ class KeywordGenerator:
         Returns:
             list: Intent-specific keywords
         """
+        location_suffix = f" in {location}" if location else ""
         intent_keywords = []
         
-        for pattern in self.intents[intent]:
-            if pattern == "in {location}" and location:
-                intent_keywords.append(f"{service} in {location}")
-            elif pattern == "{location}" and location:
-                intent_keywords.append(f"{service} {location}")
+        for kind, text in self._intent_dispatch[intent]:
+            if kind == "question":
+                intent_keywords.append(f"{text} find {service}{location_suffix}")
+            elif kind == "loc_only":
+                if location:
+                    intent_keywords.append(f"{service} {location}")
+            elif kind == "in_loc" and location:
+                intent_keywords.append(f"{service}{location_suffix}")
             else:
-                pattern_replaced = pattern.replace("{location}", location or "")
-                if not pattern_replaced.strip():
-                    continue
-                    
-                if pattern in ["how to", "what is", "ways to"]:
-                    intent_keywords.append(f"{pattern} find {service}" + (f" in {location}" if location else ""))
-                else:
-                    intent_keywords.append(f"{service} {pattern_replaced}".strip())
+                intent_keywords.append(f"{service} {text}")
         
         return intent_keywords
 
@@ -361,17 +345,20 @@ def create_keyword_generation_tool():
     """
     generator = KeywordGenerator()
     
-    def keyword_generation_tool(service: str, location: str = None) -> Dict[str, Any]:
+    def keyword_generation_tool(service: str, location: str = None,
+                                categories: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Generates keyword sets for the given service and location.
         
         Args:
             service: Service type (e.g., "plumber")
             location: Optional location to target (e.g., "33442")
+            categories: Optional keyword sets to generate, any of "primary",
+                "secondary", "long_tail", "related" and "intent" (default: all)
             
         Returns:
             dict: Generated keyword sets
         """
-        return generator.generate_keywords(service, location)
+        return generator.generate_keywords(service, location, categories=categories)
     
     return keyword_generation_tool
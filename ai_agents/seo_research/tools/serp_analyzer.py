@@ -6,14 +6,15 @@ This module provides tools for analyzing search engine result pages (SERPs)
 to gather competitive intelligence for target keywords.
 """
 
-import os
-import json
+import time
 import logging
 import random
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from pathlib import Path
 
+from ai_agents.seo_research.tools._disk_cache import JsonDiskCache
+
 logger = logging.getLogger(__name__)
 
 class SerpAnalyzer:
@@ -25,15 +26,57 @@ class SerpAnalyzer:
     simulated data for demonstration purposes.
     """
     
-    def __init__(self, cache_dir: str = "data/seo_research/serp_cache"):
+    # Templates for simulated result titles and descriptions
+    _TITLE_FORMATS = (
+        "{Quality} {query} {service_term}{location_str}",
+        "{query_title} {service_term}{location_str} | {Quality} Services",
+        "{Action} {quality} {query}{location_str}",
+        "{query_title}{location_str}: {Quality} {service_term}",
+        "Professional {query} {service_term}{location_str}"
+    )
+    _DESC_FORMATS = (
+        "Looking for {quality} {query} services{location_str}? Our experienced team provides professional solutions. Call today!",
+        "Professional {query} {service_term}{location_str}. {Quality} service, affordable rates. Free estimates!",
+        "{Quality} {query} {service_term}{location_str}. Licensed professionals with years of experience. Contact us 24/7.",
+        "Need a {query} {service_term}{location_str}? We offer {quality} solutions at competitive prices. Call now for a free quote!",
+        "{Action} {quality} {query} professionals{location_str}. Fast response, satisfaction guaranteed!"
+    )
+    
+    # Content elements and schema markup found on top-ranking pages, most common first
+    _CONTENT_ELEMENTS = (
+        "Service descriptions",
+        "Local service areas",
+        "Pricing information",
+        "Customer testimonials",
+        "Service guarantees",
+        "Emergency services",
+        "License information",
+        "Contact form",
+        "Before/after examples",
+        "FAQ section"
+    )
+    _SCHEMA_TYPES = (
+        "LocalBusiness",
+        "Service",
+        "ProfessionalService",
+        "HomeAndConstructionBusiness",
+        "FAQPage"
+    )
+    
+    def __init__(self, cache_dir: str = "data/seo_research/serp_cache",
+                 flush_interval_s: float = 5.0, simulate_latency_s: float = 0.0):
         """
         Initialize the SERP Analyzer.
         
         Args:
             cache_dir: Directory for caching SERP results
+            flush_interval_s: Minimum seconds between cache flushes to disk
+            simulate_latency_s: Seconds to sleep per uncached analysis to mimic
+                a real SERP API (disabled by default)
         """
         self.cache_dir = cache_dir
-        os.makedirs(cache_dir, exist_ok=True)
+        self.simulate_latency_s = simulate_latency_s
+        self._cache = JsonDiskCache(cache_dir, flush_interval_s)
     
     def analyze_serp(self, query: str, location: Optional[str] = None, 
                     language: str = "en", num_results: int = 10) -> Dict[str, Any]:
@@ -50,8 +93,8 @@ class SerpAnalyzer:
             dict: SERP analysis results
         """
         # Check cache first
-        cache_key = self._generate_cache_key(query, location, language)
-        cached_result = self._check_cache(cache_key)
+        cache_key = self._cache.make_key(query, location, language)
+        cached_result = self._cache.get(cache_key)
         
         if cached_result:
             logger.info(f"Using cached SERP results for {query} in {location}")
@@ -61,69 +104,18 @@ class SerpAnalyzer:
         # For demonstration, generate simulated data
         logger.info(f"Analyzing SERP for {query} in {location}")
         
-        # Simulate API call latency
-        import time
-        time.sleep(0.5)
+        # Simulate API call latency only when explicitly requested
+        if self.simulate_latency_s:
+            time.sleep(self.simulate_latency_s)
         
         # Generate simulated SERP results
         results = self._generate_simulated_results(query, location, num_results)
         
         # Cache the results
-        self._cache_results(cache_key, results)
+        self._cache.put(cache_key, results)
         
         return results
     
-    def _generate_cache_key(self, query: str, location: Optional[str], language: str) -> str:
-        """
-        Generate a cache key for the given parameters.
-        
-        Args:
-            query: Search query
-            location: Location specifier
-            language: Language code
-            
-        Returns:
-            str: Cache key
-        """
-        query_normalized = query.lower().replace(" ", "_")
-        location_part = f"_{location.lower().replace(' ', '_')}" if location else ""
-        return f"{query_normalized}{location_part}_{language}"
-    
-    def _check_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
-        """
-        Check if results are cached for the given key.
-        
-        Args:
-            cache_key: Cache key
-            
-        Returns:
-            dict: Cached results if available, None otherwise
-        """
-        cache_path = os.path.join(self.cache_dir, f"{cache_key}.json")
-        if os.path.exists(cache_path):
-            try:
-                with open(cache_path, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.error(f"Error reading cache for {cache_key}: {str(e)}")
-        
-        return None
-    
-    def _cache_results(self, cache_key: str, results: Dict[str, Any]) -> None:
-        """
-        Cache results for the given key.
-        
-        Args:
-            cache_key: Cache key
-            results: Results to cache
-        """
-        cache_path = os.path.join(self.cache_dir, f"{cache_key}.json")
-        try:
-            with open(cache_path, 'w') as f:
-                json.dump(results, f, indent=2)
-        except Exception as e:
-            logger.error(f"Error caching results for {cache_key}: {str(e)}")
-    
     def _generate_simulated_results(self, query: str, location: Optional[str], num_results: int) -> Dict[str, Any]:
         """
         Generate simulated SERP results for demonstration purposes.
@@ -142,51 +134,50 @@ class SerpAnalyzer:
         quality_terms = ["best", "top", "reliable", "trusted", "affordable", "24/7", "emergency"]
         action_terms = ["hire", "find", "book", "call", "schedule"]
         
+        # Derive the query/location strings used by every result once
+        location_str = f" in {location}" if location else ""
+        query_title = query.capitalize()
+        query_lower = query.lower()
+        slug = f"{query_lower.replace(' ', '-')}{'-' + location.lower().replace(' ', '-') if location else ''}"
+        
+        # Build each candidate URL once; results on the same domain share the string
+        domain_names = [
+            "expertservices", "procontractors", "bestlocal", "topservice", 
+            "reliablehome", "servicepros", "homeexperts", "callpro", 
+            "247services", query_lower.replace(' ', '')
+        ]
+        domain_urls = [f"https://www.{domain_name}.com/{slug}/" for domain_name in domain_names]
+        
+        # Pair each term with its capitalized form so it is only computed once
+        quality_pairs = [(term, term.capitalize()) for term in quality_terms]
+        action_titles = [term.capitalize() for term in action_terms]
+        
+        # Draw every random variation for all results up front, one batch per field
+        service_picks = random.choices(service_terms, k=num_results)
+        quality_picks = random.choices(quality_pairs, k=num_results)
+        action_picks = random.choices(action_titles, k=num_results)
+        title_picks = random.choices(self._TITLE_FORMATS, k=num_results)
+        desc_picks = random.choices(self._DESC_FORMATS, k=num_results)
+        url_picks = random.choices(domain_urls, k=num_results)
+        
         # Generate organic results
+        shared_fields = {"query": query, "query_title": query_title, "location_str": location_str}
         organic_results = []
-        for i in range(1, num_results + 1):
-            # Create random variations for realistic diversity
-            service_term = random.choice(service_terms)
-            local_term = random.choice(local_terms)
-            quality_term = random.choice(quality_terms)
-            action_term = random.choice(action_terms)
-            
-            # Generate location-aware title
-            location_str = f" in {location}" if location else ""
-            
-            title_formats = [
-                f"{quality_term.capitalize()} {query} {service_term}{location_str}",
-                f"{query.capitalize()} {service_term}{location_str} | {quality_term.capitalize()} Services",
-                f"{action_term.capitalize()} {quality_term} {query}{location_str}",
-                f"{query.capitalize()}{location_str}: {quality_term.capitalize()} {service_term}",
-                f"Professional {query} {service_term}{location_str}"
-            ]
-            
-            title = random.choice(title_formats)
-            
-            # Create URL slugs
-            domain_names = [
-                "expertservices", "procontractors", "bestlocal", "topservice", 
-                "reliablehome", "servicepros", "homeexperts", "callpro", 
-                "247services", f"{query.lower().replace(' ', '')}"
-            ]
-            
-            domain = f"{random.choice(domain_names)}.com"
-            slug = f"{query.lower().replace(' ', '-')}{'-' + location.lower().replace(' ', '-') if location else ''}"
-            url = f"https://www.{domain}/{slug}/"
-            
-            # Create description
-            desc_formats = [
-                f"Looking for {quality_term} {query} services{location_str}? Our experienced team provides professional solutions. Call today!",
-                f"Professional {query} {service_term}{location_str}. {quality_term.capitalize()} service, affordable rates. Free estimates!",
-                f"{quality_term.capitalize()} {query} {service_term}{location_str}. Licensed professionals with years of experience. Contact us 24/7.",
-                f"Need a {query} {service_term}{location_str}? We offer {quality_term} solutions at competitive prices. Call now for a free quote!",
-                f"{action_term.capitalize()} {quality_term} {query} professionals{location_str}. Fast response, satisfaction guaranteed!"
-            ]
-            
-            description = random.choice(desc_formats)
-            
-            # Add result
+        title_len_sum = 0
+        desc_len_sum = 0
+        for i, (service_term, (quality_term, quality_title), action_title, title_format, desc_format, url) in enumerate(
+                zip(service_picks, quality_picks, action_picks, title_picks, desc_picks, url_picks), start=1):
+            fields = dict(
+                shared_fields,
+                service_term=service_term,
+                quality=quality_term,
+                Quality=quality_title,
+                Action=action_title
+            )
+            title = title_format.format_map(fields)
+            description = desc_format.format_map(fields)
+            title_len_sum += len(title)
+            desc_len_sum += len(description)
             organic_results.append({
                 "position": i,
                 "title": title,
@@ -194,9 +185,6 @@ class SerpAnalyzer:
                 "description": description
             })
         
-        # Extract common keywords from titles and descriptions
-        all_text = " ".join([r["title"] + " " + r["description"] for r in organic_results]).lower()
-        
         # Generate common keywords
         common_keywords = [
             f"{query} {location}" if location else query,
@@ -207,34 +195,9 @@ class SerpAnalyzer:
             f"{query} {location} {service_terms[1]}" if location else f"{query} {service_terms[1]}"
         ]
         
-        # Analyze content elements used in top results
-        content_elements = [
-            "Service descriptions",
-            "Local service areas",
-            "Pricing information",
-            "Customer testimonials",
-            "Service guarantees",
-            "Emergency services",
-            "License information",
-            "Contact form",
-            "Before/after examples",
-            "FAQ section"
-        ]
-        
-        # Randomly select a subset of content elements that appear most frequently
-        frequent_elements = random.sample(content_elements, k=min(6, len(content_elements)))
-        
-        # Analyze schema markup used
-        schema_types = [
-            "LocalBusiness",
-            "Service",
-            "ProfessionalService",
-            "HomeAndConstructionBusiness",
-            "FAQPage"
-        ]
-        
-        # Randomly select which schema types are commonly used
-        common_schema = random.sample(schema_types, k=min(3, len(schema_types)))
+        # Content elements and schema types that appear most frequently in top results
+        frequent_elements = list(self._CONTENT_ELEMENTS[:6])
+        common_schema = list(self._SCHEMA_TYPES[:3])
         
         return {
             "query": query,
@@ -245,8 +208,8 @@ class SerpAnalyzer:
             "local_pack_present": True if location else False,
             "analysis": {
                 "common_keywords": common_keywords,
-                "average_title_length": sum(len(r["title"]) for r in organic_results) // len(organic_results),
-                "average_description_length": sum(len(r["description"]) for r in organic_results) // len(organic_results),
+                "average_title_length": title_len_sum // len(organic_results),
+                "average_description_length": desc_len_sum // len(organic_results),
                 "frequent_content_elements": frequent_elements,
                 "common_schema_markup": common_schema
             }
@@ -7,12 +7,20 @@ with shared functionality for configuration, logging, and error handling.
 """
 
 import os
+import re
+import copy
 import time
 import yaml
+import queue
+import atexit
+import orjson
 import logging
+import logging.handlers
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Union, Tuple
 
 # Import ADK components
 from google.adk.agents import Agent, LlmAgent
@@ -20,8 +28,165 @@ from google.adk.models.lite_llm import LiteLlm
 from google.adk.sessions import InMemorySessionService
 from google.adk.runners import Runner
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 logger = logging.getLogger(__name__)
 
+# Session store shared by every agent in the process. Sessions are keyed by each
+# runner's app name, so agents sharing the store can't collide.
+_DEFAULT_SESSION_SERVICE = InMemorySessionService()
+
+# Background listener that writes "agent.*" log records, see _start_agent_log_listener
+_agent_log_listener: Optional[logging.handlers.QueueListener] = None
+_agent_log_listener_lock = threading.Lock()
+
+class _RootForwardingHandler(logging.Handler):
+    """
+    Passes records to the handlers the root logger has when each record is
+    emitted, so handlers added after the listener starts still receive them.
+    """
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger().handle(record)
+
+def _start_agent_log_listener() -> None:
+    """
+    Route "agent.*" log records through a queue to the root logger's handlers on a
+    background thread, so agents never block on stream/file writes.
+    
+    The listener looks up the root handlers per record rather than capturing them
+    at start, so later logging configuration (basicConfig(force=True), extra file
+    handlers, test log capture) applies to agent records too. It starts on first
+    agent construction so importing the agents doesn't spawn a thread.
+    """
+    global _agent_log_listener
+    with _agent_log_listener_lock:
+        if _agent_log_listener is not None:
+            return
+        
+        log_queue = queue.Queue(-1)
+        _agent_log_listener = logging.handlers.QueueListener(log_queue, _RootForwardingHandler())
+        _agent_log_listener.start()
+        atexit.register(_agent_log_listener.stop)
+        
+        # The listener already feeds the root handlers; don't deliver records twice
+        agent_logger = logging.getLogger("agent")
+        agent_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        agent_logger.propagate = False
+
+# Parsed config files keyed by absolute path, with the (mtime, size) they were
+# parsed at, so agents created in the same process share one parse per file
+_CONFIG_CACHE: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+_CONFIG_CACHE_SIZE = 100
+# Agents may be constructed from worker threads; this also keeps them from
+# writing the same sidecar file concurrently
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+# Whole-value variable references such as "${models.default}"
+_REF_PATTERN = re.compile(r'^\$\{([\w.]+)\}$')
+
+def _expand_refs(node: Any, root: Dict[str, Any], resolved: Dict[str, Any]) -> Any:
+    """
+    Replace "${a.b}" string values with the value at that path in the config.
+    
+    Args:
+        node: Config subtree to expand
+        root: Full configuration the references point into
+        resolved: Memo of already-resolved reference paths
+        
+    Returns:
+        Any: Expanded subtree; unresolvable references are left as-is
+    """
+    if isinstance(node, dict):
+        return {key: _expand_refs(value, root, resolved) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_expand_refs(value, root, resolved) for value in node]
+    if isinstance(node, str):
+        match = _REF_PATTERN.match(node)
+        if match:
+            ref_path = match.group(1)
+            if ref_path not in resolved:
+                value = root
+                for key in ref_path.split('.'):
+                    value = value.get(key) if isinstance(value, dict) else None
+                resolved[ref_path] = value if value else node
+            return resolved[ref_path]
+    return node
+
+def _parse_config_file(config_file: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a YAML config file, going through a JSON sidecar (<file>.cache.json)
+    that is much faster to load than YAML on a cold start.
+    
+    The sidecar records the mtime and size of the YAML it was built from and is
+    only used while both match exactly, so a YAML restored with an older mtime
+    (cp -p, rsync -t, tar) is still reparsed.
+    
+    Args:
+        config_file: Absolute path to configuration file
+        mtime_ns: Modification time of the YAML file
+        size: Size of the YAML file in bytes
+        
+    Returns:
+        dict: Parsed configuration
+    """
+    sidecar_path = f"{config_file}.cache.json"
+    try:
+        with open(sidecar_path, 'rb') as f:
+            sidecar = orjson.loads(f.read())
+        if (isinstance(sidecar, dict) and sidecar.get("mtime_ns") == mtime_ns
+                and sidecar.get("size") == size and "config" in sidecar):
+            return sidecar["config"]
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring config cache {sidecar_path}: {str(e)}")
+    
+    with open(config_file, 'r') as f:
+        config = yaml.load(f, Loader=_SafeLoader)
+    
+    # Refresh the sidecar; failing to write it (e.g. read-only config dir) is not fatal
+    try:
+        tmp_path = f"{sidecar_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps({"mtime_ns": mtime_ns, "size": size, "config": config}))
+        os.replace(tmp_path, sidecar_path)
+    except Exception as e:
+        logger.warning(f"Failed to write config cache {sidecar_path}: {str(e)}")
+    
+    return config
+
+def _read_config_file(config_path: str) -> Dict[str, Any]:
+    """
+    Parse a YAML config file, reusing the cached parse while the file is unchanged.
+    
+    Args:
+        config_path: Path to configuration file
+        
+    Returns:
+        dict: The cached parsed configuration, shared between callers (do not mutate)
+    """
+    config_file = os.path.abspath(config_path)
+    stat = os.stat(config_file)
+    
+    with _CONFIG_CACHE_LOCK:
+        cached = _CONFIG_CACHE.get(config_file)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            _CONFIG_CACHE.move_to_end(config_file)
+            config = cached[2]
+        else:
+            config = _parse_config_file(config_file, stat.st_mtime_ns, stat.st_size)
+            config = _expand_refs(config, config, {})
+            _CONFIG_CACHE[config_file] = (stat.st_mtime_ns, stat.st_size, config)
+            _CONFIG_CACHE.move_to_end(config_file)
+            if len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+                _CONFIG_CACHE.popitem(last=False)
+    
+    return config
+
 class BaseAgent:
     """
     Base class for all agents in the Website Expansion Framework.
@@ -30,13 +195,16 @@ class BaseAgent:
     standardized logging, error handling, and agent initialization.
     """
     
-    def __init__(self, agent_type: str, config_path: str = "config/agent_config.yaml"):
+    def __init__(self, agent_type: str, config_path: str = "config/agent_config.yaml",
+                 session_service: Optional[InMemorySessionService] = None):
         """
         Initialize the base agent.
         
         Args:
             agent_type: Type of agent (e.g., 'orchestrator', 'seo_research')
             config_path: Path to the agent configuration file
+            session_service: Optional session service; defaults to the one shared
+                by all agents in the process
         """
         self.agent_type = agent_type
         self.config = self._load_config(config_path)
@@ -44,10 +212,11 @@ class BaseAgent:
         self.global_config = self.config['global']
         
         # Set up agent-specific logger
+        _start_agent_log_listener()
         self.logger = logging.getLogger(f"agent.{agent_type}")
         
         # Initialize ADK components
-        self.session_service = InMemorySessionService()
+        self.session_service = session_service or _DEFAULT_SESSION_SERVICE
         self.agent = None
         self.runner = None
         
@@ -66,9 +235,15 @@ class BaseAgent:
             dict: Configuration dictionary
         """
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
-            return config
+            config = _read_config_file(config_path)
+            
+            # Copy out only the sections this agent uses; the shared parse is
+            # never handed out, so per-agent mutation can't leak between agents
+            return {
+                'global': copy.deepcopy(config['global']),
+                'models': copy.deepcopy(config['models']),
+                'agents': {self.agent_type: copy.deepcopy(config['agents'].get(self.agent_type, {}))}
+            }
         except Exception as e:
             logger.error(f"Failed to load configuration from {config_path}: {str(e)}")
             # Return default configuration
@@ -103,18 +278,12 @@ class BaseAgent:
         Returns:
             Union[str, LiteLlm]: Resolved model name or LiteLlm object
         """
-        if not model_key:
-            # Use default model if not specified
+        if not model_key or model_key.startswith('${'):
+            # Use default model if not specified. References like ${models.default}
+            # are expanded when the config is loaded, so one still present here
+            # could not be resolved.
             return self.config['models']['default']
         
-        if model_key.startswith('${') and model_key.endswith('}'): 
-            # Handle variable references like ${models.default}
-            var_path = model_key[2:-1].split('.')
-            value = self.config
-            for key in var_path:
-                value = value.get(key, '')
-            return value if value else self.config['models']['default']
-        
         # Direct model name
         return model_key
     
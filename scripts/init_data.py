@@ -7,10 +7,12 @@ and prepares the system for operation.
 """
 
 import os
+import csv
 import json
+import orjson
 import logging
+import itertools
 import argparse
-import pandas as pd
 from pathlib import Path
 
 # Configure logging
@@ -21,6 +23,26 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Location CSV columns parsed as numbers; everything else (notably zip codes,
+# which can have leading zeros) stays a string
+_NUMERIC_LOCATION_FIELDS = ("lat", "lng", "latitude", "longitude")
+
+def _read_csv_rows(file_path):
+    """
+    Read a CSV file into a list of dicts, mapping empty cells to None.
+    
+    Args:
+        file_path: Path to the CSV file
+        
+    Returns:
+        list: One dict per row, keyed by the header columns
+    """
+    with open(file_path, newline='') as f:
+        return [
+            {key: (value if value != '' else None) for key, value in row.items()}
+            for row in csv.DictReader(f)
+        ]
+
 def create_directory_structure():
     """
     Create the necessary directory structure for data storage.
@@ -51,31 +73,32 @@ def import_location_data(file_path=None):
     if file_path and os.path.exists(file_path):
         # Import from provided CSV file
         try:
-            df = pd.read_csv(file_path)
-            logger.info(f"Imported {len(df)} locations from {file_path}")
+            locations = _read_csv_rows(file_path)
+            for location in locations:
+                for field in _NUMERIC_LOCATION_FIELDS:
+                    if location.get(field) is not None:
+                        location[field] = float(location[field])
+            logger.info(f"Imported {len(locations)} locations from {file_path}")
         except Exception as e:
             logger.error(f"Failed to import locations from {file_path}: {str(e)}")
             return
     else:
         # Create sample location data
         logger.info("No location file provided. Creating sample location data.")
-        sample_locations = [
+        locations = [
             {"zip": "33442", "city": "Deerfield Beach", "state": "FL", "lat": 26.3173, "lng": -80.0999},
             {"zip": "90210", "city": "Beverly Hills", "state": "CA", "lat": 34.0901, "lng": -118.4065},
             {"zip": "10001", "city": "New York", "state": "NY", "lat": 40.7501, "lng": -73.9997},
             {"zip": "60601", "city": "Chicago", "state": "IL", "lat": 41.8842, "lng": -87.6222},
             {"zip": "75201", "city": "Dallas", "state": "TX", "lat": 32.7848, "lng": -96.7975}
         ]
-        
-        # Convert to DataFrame for consistent processing
-        df = pd.DataFrame(sample_locations)
     
     # Add processing status field
-    df['status'] = 'pending'
-    df['last_updated'] = None
+    for location in locations:
+        location['status'] = 'pending'
+        location['last_updated'] = None
     
     # Save to JSON
-    locations = df.to_dict(orient='records')
     with open(output_path, 'w') as f:
         json.dump(locations, f, indent=2)
     
@@ -93,15 +116,19 @@ def import_service_data(file_path=None):
     if file_path and os.path.exists(file_path):
         # Import from provided CSV file
         try:
-            df = pd.read_csv(file_path)
-            logger.info(f"Imported {len(df)} services from {file_path}")
+            services = _read_csv_rows(file_path)
+            for service in services:
+                # Keywords are a comma-separated list within the CSV cell
+                if service.get('keywords') is not None:
+                    service['keywords'] = [k.strip() for k in service['keywords'].split(',') if k.strip()]
+            logger.info(f"Imported {len(services)} services from {file_path}")
         except Exception as e:
             logger.error(f"Failed to import services from {file_path}: {str(e)}")
             return
     else:
         # Create sample service data
         logger.info("No service file provided. Creating sample service data.")
-        sample_services = [
+        services = [
             {
                 "service_id": "plumber", 
                 "display_name": "Plumber", 
@@ -133,12 +160,8 @@ def import_service_data(file_path=None):
                 "description": "Professional landscaping and lawn maintenance services."
             }
         ]
-        
-        # Convert to DataFrame for consistent processing
-        df = pd.DataFrame(sample_services)
     
     # Save to JSON
-    services = df.to_dict(orient='records')
     with open(output_path, 'w') as f:
         json.dump(services, f, indent=2)
     
@@ -209,31 +232,39 @@ def create_task_queue():
     """
     try:
         # Load locations and services
-        with open("data/locations/locations.json", 'r') as f:
-            locations = json.load(f)
+        with open("data/locations/locations.json", 'rb') as f:
+            locations = orjson.loads(f.read())
         
-        with open("data/services/services.json", 'r') as f:
-            services = json.load(f)
+        with open("data/services/services.json", 'rb') as f:
+            services = orjson.loads(f.read())
+        
+        # Pull the per-location and per-service fields out once, so building each
+        # task is a single string concatenation plus a dict literal
+        location_rows = [
+            (location['zip'], str(location['zip']), location['city'], location['state'])
+            for location in locations
+        ]
+        service_rows = [(service['service_id'], f"{service['service_id']}_") for service in services]
         
         # Create all combinations for the queue
-        queue = []
-        for service in services:
-            for location in locations:
-                task = {
-                    "task_id": f"{service['service_id']}_{location['zip']}",
-                    "service_id": service['service_id'],
-                    "zip": location['zip'],
-                    "city": location['city'],
-                    "state": location['state'],
-                    "status": "pending",
-                    "created_at": None,
-                    "updated_at": None
-                }
-                queue.append(task)
+        queue = [
+            {
+                "task_id": task_prefix + zip_str,
+                "service_id": service_id,
+                "zip": zip_code,
+                "city": city,
+                "state": state,
+                "status": "pending",
+                "created_at": None,
+                "updated_at": None
+            }
+            for (service_id, task_prefix), (zip_code, zip_str, city, state)
+            in itertools.product(service_rows, location_rows)
+        ]
         
         # Save queue to JSON
-        with open("data/queue/task_queue.json", 'w') as f:
-            json.dump(queue, f, indent=2)
+        with open("data/queue/task_queue.json", 'wb') as f:
+            f.write(orjson.dumps(queue))
         
         logger.info(f"Created task queue with {len(queue)} tasks")
     
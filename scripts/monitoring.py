@@ -7,8 +7,8 @@ including progress tracking, error reporting, and performance metrics.
 """
 
 import os
-import json
 import time
+import orjson
 import logging
 import argparse
 from datetime import datetime, timedelta
@@ -23,120 +23,121 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+QUEUE_PATH = "data/queue/task_queue.json"
+
+# (mtime_ns, size, tasks) from the last successful load, reused while the file is unchanged
+_queue_cache = None
+
 def load_task_queue():
     """
     Load the current task queue from storage.
     
+    The parsed queue is reused across refreshes until the file changes on disk.
+    
     Returns:
         list: The task queue data.
     """
+    global _queue_cache
     try:
-        with open("data/queue/task_queue.json", 'r') as f:
-            return json.load(f)
+        stat = os.stat(QUEUE_PATH)
+        if _queue_cache and _queue_cache[0] == stat.st_mtime_ns and _queue_cache[1] == stat.st_size:
+            return _queue_cache[2]
+        
+        with open(QUEUE_PATH, 'rb') as f:
+            tasks = orjson.loads(f.read())
+        _queue_cache = (stat.st_mtime_ns, stat.st_size, tasks)
+        return tasks
     except Exception as e:
         logger.error(f"Failed to load task queue: {str(e)}")
         return []
 
-def get_task_status_summary(tasks):
+def _updated_after(updated_at, cutoff, cutoff_iso):
     """
-    Generate a summary of task statuses.
+    Check whether an ISO timestamp string is later than a cutoff.
     
-    Args:
-        tasks: List of tasks from the queue.
-        
-    Returns:
-        dict: Summary of status counts.
-    """
-    status_counts = Counter(task['status'] for task in tasks)
-    total = len(tasks)
-    
-    summary = {
-        'total': total,
-        'counts': dict(status_counts),
-        'percentages': {}
-    }
-    
-    # Calculate percentages
-    for status, count in status_counts.items():
-        summary['percentages'][status] = round((count / total) * 100, 2) if total > 0 else 0
-    
-    return summary
-
-def get_recent_errors(tasks, hours=24):
-    """
-    Identify tasks with errors in the recent time period.
+    Naive timestamps written by datetime.isoformat() (with or without
+    microseconds) sort lexicographically, so they are compared as strings
+    without parsing. Anything else falls back to datetime.fromisoformat.
     
     Args:
-        tasks: List of tasks from the queue.
-        hours: Number of hours to look back.
+        updated_at: ISO timestamp string from a task.
+        cutoff: Cutoff as a datetime.
+        cutoff_iso: The same cutoff as an isoformat() string.
         
     Returns:
-        list: Tasks with errors in the specified timeframe.
-    """
-    recent_errors = []
-    cutoff_time = datetime.now() - timedelta(hours=hours)
-    
-    for task in tasks:
-        if task['status'] == 'error' and task.get('updated_at'):
-            try:
-                updated_time = datetime.fromisoformat(task['updated_at'])
-                if updated_time > cutoff_time:
-                    recent_errors.append(task)
-            except (ValueError, TypeError):
-                # Skip tasks with invalid timestamps
-                pass
-    
-    return recent_errors
-
-def get_completion_rate(tasks, hours=1):
-    """
-    Calculate the completion rate (tasks completed per hour).
+        bool: True if the timestamp is after the cutoff.
     
-    Args:
-        tasks: List of tasks from the queue.
-        hours: Number of hours to calculate rate for.
-        
-    Returns:
-        float: Tasks completed per hour.
+    Raises:
+        ValueError, TypeError: If the timestamp cannot be parsed.
     """
-    completed_recently = 0
-    cutoff_time = datetime.now() - timedelta(hours=hours)
-    
-    for task in tasks:
-        if task['status'] == 'completed' and task.get('updated_at'):
-            try:
-                updated_time = datetime.fromisoformat(task['updated_at'])
-                if updated_time > cutoff_time:
-                    completed_recently += 1
-            except (ValueError, TypeError):
-                # Skip tasks with invalid timestamps
-                pass
-    
-    return completed_recently / hours if hours > 0 else 0
+    if len(updated_at) in (19, 26) and updated_at[4] == '-' and updated_at[10] == 'T':
+        return updated_at > cutoff_iso
+    return datetime.fromisoformat(updated_at) > cutoff
 
-def get_service_status_breakdown(tasks):
+def summarize_tasks(tasks, error_hours=24, rate_hours=1):
     """
-    Break down task status by service type.
+    Compute all monitoring summaries in a single pass over the task list:
+    status counts and percentages, recent errors, the completion rate (tasks
+    completed per hour) and a per-service status breakdown.
     
     Args:
         tasks: List of tasks from the queue.
+        error_hours: Number of hours to look back for errors.
+        rate_hours: Number of hours to calculate the completion rate for.
         
     Returns:
-        dict: Status breakdown by service.
+        tuple: (status_summary, recent_errors, completion_rate, service_breakdown)
     """
+    now = datetime.now()
+    error_cutoff = now - timedelta(hours=error_hours)
+    rate_cutoff = now - timedelta(hours=rate_hours)
+    error_cutoff_iso = error_cutoff.isoformat()
+    rate_cutoff_iso = rate_cutoff.isoformat()
+    
+    status_counts = Counter()
+    recent_errors = []
+    completed_recently = 0
     service_breakdown = {}
     
     for task in tasks:
-        service_id = task.get('service_id')
-        status = task.get('status')
+        status = task['status']
+        status_counts[status] += 1
         
+        service_id = task.get('service_id')
         if service_id and status:
-            if service_id not in service_breakdown:
-                service_breakdown[service_id] = Counter()
-            
-            service_breakdown[service_id][status] += 1
+            counts = service_breakdown.get(service_id)
+            if counts is None:
+                counts = service_breakdown[service_id] = Counter()
+            counts[status] += 1
+        
+        # Only error and completed tasks need their timestamp checked
+        if status != 'error' and status != 'completed':
+            continue
+        updated_at = task.get('updated_at')
+        if not updated_at:
+            continue
+        try:
+            if status == 'error':
+                if _updated_after(updated_at, error_cutoff, error_cutoff_iso):
+                    recent_errors.append(task)
+            elif _updated_after(updated_at, rate_cutoff, rate_cutoff_iso):
+                completed_recently += 1
+        except (ValueError, TypeError):
+            # Skip tasks with invalid timestamps
+            pass
+    
+    total = len(tasks)
+    status_summary = {
+        'total': total,
+        'counts': dict(status_counts),
+        'percentages': {
+            status: round((count / total) * 100, 2) if total > 0 else 0
+            for status, count in status_counts.items()
+        }
+    }
+    completion_rate = completed_recently / rate_hours if rate_hours > 0 else 0
     
-    return service_breakdown
+    return status_summary, recent_errors, completion_rate, service_breakdown
 
 def display_summary(tasks):
     """
@@ -145,10 +146,7 @@ def display_summary(tasks):
     Args:
         tasks: List of tasks from the queue.
     """
-    status_summary = get_task_status_summary(tasks)
-    recent_errors = get_recent_errors(tasks)
-    completion_rate = get_completion_rate(tasks)
-    service_breakdown = get_service_status_breakdown(tasks)
+    status_summary, recent_errors, completion_rate, service_breakdown = summarize_tasks(tasks)
     
     print("\n=== Website Expansion Framework - Status Summary ===\n")
     
@@ -6,9 +6,15 @@ This script initializes the Orchestrator Agent and starts the autonomous page ge
 """
 
 import os
+import sys
 import asyncio
 import logging
 from dotenv import load_dotenv
+
+# Make the repository root importable once, at the entry point, so the
+# agent packages can use plain absolute imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from src.services.orchestrator_service import OrchestratorService
 
 # Configure logging
@@ -38,6 +38,23 @@ class OrchestratorService:
         self.publisher_agent = None
         self.orchestrator_agent = None
     
+    @staticmethod
+    def _create_agent(agent_class: type, name: str) -> Any:
+        """
+        Construct and initialize a specialized agent.
+        
+        Args:
+            agent_class: Agent class to instantiate
+            name: Display name used for logging
+            
+        Returns:
+            The initialized agent
+        """
+        agent = agent_class()
+        agent.initialize_agent()
+        logger.info(f"{name} initialized")
+        return agent
+    
     async def initialize_agents(self):
         """
         Initialize all agents in the system.
@@ -45,22 +62,19 @@ class OrchestratorService:
         logger.info("Initializing agents...")
         
         try:
-            # Initialize specialized agents
-            self.seo_agent = SeoResearchAgent()
-            self.seo_agent.initialize_agent()
-            logger.info("SEO Research Agent initialized")
-            
-            self.content_agent = ContentGeneratorAgent()
-            self.content_agent.initialize_agent()
-            logger.info("Content Generator Agent initialized")
-            
-            self.page_agent = PageAssemblerAgent()
-            self.page_agent.initialize_agent()
-            logger.info("Page Assembler Agent initialized")
-            
-            self.publisher_agent = PublisherAgent()
-            self.publisher_agent.initialize_agent()
-            logger.info("Publisher Agent initialized")
+            # Initialize specialized agents concurrently; constructors and
+            # initialize_agent are blocking, so each runs in a worker thread
+            (
+                self.seo_agent,
+                self.content_agent,
+                self.page_agent,
+                self.publisher_agent
+            ) = await asyncio.gather(
+                asyncio.to_thread(self._create_agent, SeoResearchAgent, "SEO Research Agent"),
+                asyncio.to_thread(self._create_agent, ContentGeneratorAgent, "Content Generator Agent"),
+                asyncio.to_thread(self._create_agent, PageAssemblerAgent, "Page Assembler Agent"),
+                asyncio.to_thread(self._create_agent, PublisherAgent, "Publisher Agent")
+            )
             
             # Initialize orchestrator with sub-agents
             self.orchestrator_agent = OrchestratorAgent()
@@ -7,8 +7,13 @@ reading, updating, and tracking task status.
 """
 
 import os
-import json
+import stat
+import atexit
+import asyncio
+import tempfile
 import logging
+import threading
+import orjson
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from pathlib import Path
@@ -17,20 +22,50 @@ from src.models.task import Task, TaskStatus
 
 logger = logging.getLogger(__name__)
 
+# Statuses that end a task's processing and set its completed_at. TaskStatus is a
+# str enum, so both enum members and raw status strings match these values.
+_TERMINAL_STATUSES = frozenset({
+    TaskStatus.PUBLISHED.value,
+    TaskStatus.FAILED.value,
+    TaskStatus.ERROR.value
+})
+
 class QueueManager:
     """
     Manages the task queue for service/location processing.
     """
     
-    def __init__(self, queue_path: str = "data/queue/task_queue.json"):
+    def __init__(self, queue_path: str = "data/queue/task_queue.json", flush_threshold: int = 64):
         """
         Initialize the Queue Manager.
         
         Args:
             queue_path: Path to the task queue file
+            flush_threshold: Number of changed tasks to accumulate in memory before
+                the queue is written back to disk
         """
         self.queue_path = queue_path
+        self.flush_threshold = flush_threshold
+        
+        # Parsed queue and the file mtime it was read at; reloaded only when the
+        # file changes on disk, so lookups don't re-read and re-parse the whole queue
+        self._queue: Optional[List[Dict[str, Any]]] = None
+        self._queue_mtime: Optional[int] = None
+        self._index: Dict[str, Dict[str, Any]] = {}
+        
+        # IDs of tasks changed in memory since the last write
+        self._dirty: set = set()
+        self._async_flush_running = False
+        
+        # Every serialized snapshot gets the next generation number. Writes hold
+        # _write_lock and skip a snapshot older than one already on disk, so a
+        # slow async flush can't overwrite a newer synchronous save.
+        self._generation = 0
+        self._written_generation = 0
+        self._write_lock = threading.Lock()
+        
         self._ensure_queue_exists()
+        atexit.register(self.flush)
     
     def _ensure_queue_exists(self):
         """
@@ -41,19 +76,28 @@ class QueueManager:
         
         if not os.path.exists(self.queue_path):
             # Create an empty queue file
-            with open(self.queue_path, 'w') as f:
-                json.dump([], f)
+            with open(self.queue_path, 'wb') as f:
+                f.write(orjson.dumps([]))
     
     def load_queue(self) -> List[Dict[str, Any]]:
         """
-        Load the task queue from storage.
+        Load the task queue from storage, reusing the cached copy while the file
+        is unchanged.
         
         Returns:
-            list: The task queue
+            list: The task queue (the manager's cached list; save changes with save_queue)
         """
         try:
-            with open(self.queue_path, 'r') as f:
-                return json.load(f)
+            mtime = os.stat(self.queue_path).st_mtime_ns
+            # Unflushed local changes, and a write of them still in flight, win
+            # over a concurrent rewrite of the file
+            if self._queue is None or (
+                mtime != self._queue_mtime and not self._dirty and not self._async_flush_running
+            ):
+                with open(self.queue_path, 'rb') as f:
+                    self._set_queue(orjson.loads(f.read()))
+                self._queue_mtime = mtime
+            return self._queue
         except Exception as e:
             logger.error(f"Failed to load task queue: {str(e)}")
             return []
@@ -62,15 +106,165 @@ class QueueManager:
         """
         Save the task queue to storage.
         
+        The queue is written to a temporary file in the same directory, fsynced
+        once and renamed over the queue file, so a crash mid-write never leaves a
+        truncated queue behind.
+        
         Args:
             queue: The task queue to save
         """
         try:
-            with open(self.queue_path, 'w') as f:
-                json.dump(queue, f, indent=2)
+            self._write_queue_file(orjson.dumps(queue), self._next_generation())
+            if queue is not self._queue:
+                self._set_queue(queue)
+            self._queue_mtime = os.stat(self.queue_path).st_mtime_ns
+            self._dirty.clear()
         except Exception as e:
             logger.error(f"Failed to save task queue: {str(e)}")
     
+    def _next_generation(self) -> int:
+        """
+        Number a new queue snapshot; call right before serializing it.
+        
+        Returns:
+            int: Generation of the snapshot
+        """
+        self._generation += 1
+        return self._generation
+    
+    def _write_queue_file(self, data: bytes, generation: int) -> None:
+        """
+        Atomically replace the queue file with the given serialized queue,
+        unless a newer snapshot has already been written.
+        
+        Args:
+            data: Serialized task queue
+            generation: Generation of the snapshot, from _next_generation
+        """
+        with self._write_lock:
+            if generation <= self._written_generation:
+                return
+            self._replace_queue_file(data)
+            self._written_generation = generation
+    
+    def _replace_queue_file(self, data: bytes) -> None:
+        """
+        Write data to a temporary file, fsync it and rename it over the queue file.
+        
+        Args:
+            data: Serialized task queue
+        """
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(self.queue_path)), suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                # mkstemp creates the file 0600; keep the existing queue's permissions
+                try:
+                    os.chmod(tmp_path, stat.S_IMODE(os.stat(self.queue_path).st_mode))
+                except FileNotFoundError:
+                    pass
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.queue_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+    
+    def _set_queue(self, queue: List[Dict[str, Any]]) -> None:
+        """
+        Cache a queue and index its tasks by task_id.
+        
+        Args:
+            queue: The task queue
+        """
+        self._queue = queue
+        self._index = {task['task_id']: task for task in queue if task.get('task_id')}
+    
+    def flush(self) -> None:
+        """
+        Write pending in-memory task changes to disk.
+        """
+        if self._dirty and self._queue is not None:
+            self.save_queue(self._queue)
+    
+    async def flush_async(self) -> None:
+        """
+        Write pending in-memory task changes to disk without blocking the event loop.
+        
+        The queue is serialized on the calling thread, so the snapshot is consistent,
+        and only the file write and fsync run in a worker thread. Changes made while
+        the write is in flight stay pending for the next flush, and if a newer
+        snapshot is saved meanwhile (e.g. by flush()), this write is dropped.
+        """
+        if not self._dirty or self._queue is None or self._async_flush_running:
+            return
+        
+        # Take the pending set before serializing: anything updated from here on,
+        # including tasks already in this batch, is marked dirty again
+        written, self._dirty = self._dirty, set()
+        self._async_flush_running = True
+        try:
+            generation = self._next_generation()
+            data = orjson.dumps(self._queue)
+            await asyncio.to_thread(self._write_queue_file, data, generation)
+            self._queue_mtime = os.stat(self.queue_path).st_mtime_ns
+        except Exception as e:
+            logger.error(f"Failed to save task queue: {str(e)}")
+            self._dirty |= written
+        finally:
+            self._async_flush_running = False
+    
+    def _mark_dirty(self, task_ids) -> None:
+        """
+        Record changed tasks and flush once enough changes have accumulated.
+        
+        Args:
+            task_ids: IDs of the tasks that changed
+        """
+        self._dirty.update(task_ids)
+        if len(self._dirty) >= self.flush_threshold:
+            self.flush()
+    
+    def add_tasks(self, tasks: List[Dict[str, Any]]) -> int:
+        """
+        Add new tasks to the queue with a single write.
+        
+        Tasks whose task_id is missing or already queued are skipped. Missing
+        status and timestamps are filled in as for a newly created task.
+        
+        Args:
+            tasks: Task records to add
+            
+        Returns:
+            int: Number of tasks added
+        """
+        queue = self.load_queue()
+        now = datetime.now().isoformat()
+        
+        added = 0
+        for task in tasks:
+            task_id = task.get('task_id')
+            if not task_id or task_id in self._index:
+                continue
+            
+            new_task = dict(task)
+            new_task.setdefault('status', TaskStatus.PENDING)
+            new_task.setdefault('created_at', now)
+            new_task.setdefault('updated_at', now)
+            queue.append(new_task)
+            self._index[task_id] = new_task
+            added += 1
+        
+        if added:
+            self.save_queue(queue)
+        
+        return added
+    
     def get_pending_tasks(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get a list of pending tasks up to the specified limit.
@@ -85,7 +279,9 @@ class QueueManager:
         pending_tasks = []
         
         for task in queue:
-            if task['status'] == TaskStatus.PENDING and len(pending_tasks) < limit:
+            if len(pending_tasks) >= limit:
+                break
+            if task['status'] == TaskStatus.PENDING:
                 pending_tasks.append(task)
         
         return pending_tasks
@@ -97,18 +293,20 @@ class QueueManager:
         Args:
             tasks: Tasks to mark as in progress
         """
-        queue = self.load_queue()
-        task_ids = [task['task_id'] for task in tasks]
+        self.load_queue()
+        task_ids = frozenset(task['task_id'] for task in tasks)
         
-        updated = False
-        for task in queue:
-            if task['task_id'] in task_ids and task['status'] == TaskStatus.PENDING:
+        # Look the batch up through the task_id index instead of scanning the queue
+        updated = []
+        for task_id in task_ids:
+            task = self._index.get(task_id)
+            if task is not None and task['status'] == TaskStatus.PENDING:
                 task['status'] = TaskStatus.IN_PROGRESS
                 task['updated_at'] = datetime.now().isoformat()
-                updated = True
+                updated.append(task_id)
         
         if updated:
-            self.save_queue(queue)
+            self._mark_dirty(updated)
     
     def update_task_status(self, task_id: str, status: str, 
                            result: Optional[Dict[str, Any]] = None) -> None:
@@ -120,28 +318,58 @@ class QueueManager:
             status: New status
             result: Optional result data
         """
-        queue = self.load_queue()
+        if self._apply_task_status(task_id, status, result):
+            self._mark_dirty((task_id,))
+    
+    async def update_task_status_async(self, task_id: str, status: str,
+                                       result: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Update the status of a task, flushing to disk without blocking the event loop.
         
-        for task in queue:
-            if task.get('task_id') == task_id:
-                task['status'] = status
-                task['updated_at'] = datetime.now().isoformat()
-                
-                # For completed or failed tasks, set completed_at
-                if status in [TaskStatus.PUBLISHED, TaskStatus.FAILED, TaskStatus.ERROR]:
-                    task['completed_at'] = datetime.now().isoformat()
-                
-                # Update with result data if provided
-                if result:
-                    # Add any relevant fields from result
-                    if 'url' in result:
-                        task['url'] = result['url']
-                    if 'error' in result:
-                        task['error_message'] = result['error']
-                
-                break
+        Args:
+            task_id: Task identifier
+            status: New status
+            result: Optional result data
+        """
+        if self._apply_task_status(task_id, status, result):
+            self._dirty.add(task_id)
+            if len(self._dirty) >= self.flush_threshold:
+                await self.flush_async()
+    
+    def _apply_task_status(self, task_id: str, status: str,
+                           result: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Apply a status update to the in-memory queue.
+        
+        Args:
+            task_id: Task identifier
+            status: New status
+            result: Optional result data
+            
+        Returns:
+            bool: True if the task exists and was updated
+        """
+        self.load_queue()
+        task = self._index.get(task_id)
+        if task is None:
+            return False
+        
+        task['status'] = status
+        task['updated_at'] = datetime.now().isoformat()
+        
+        # For completed or failed tasks, set completed_at
+        if status in _TERMINAL_STATUSES:
+            task['completed_at'] = datetime.now().isoformat()
         
-        self.save_queue(queue)
+        # Update with result data if provided
+        if result:
+            # Add any relevant fields from result
+            if 'url' in result:
+                task['url'] = result['url']
+            if 'error' in result:
+                task['error_message'] = result['error']
+        
+        return True
     
     def get_task_by_id(self, task_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -153,13 +381,8 @@ class QueueManager:
         Returns:
             dict: Task data if found, None otherwise
         """
-        queue = self.load_queue()
-        
-        for task in queue:
-            if task.get('task_id') == task_id:
-                return task
-        
-        return None
+        self.load_queue()
+        return self._index.get(task_id)
     
     def get_queue_stats(self) -> Dict[str, Any]:
         """
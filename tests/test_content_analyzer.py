@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for the Content Analyzer tool's result caching.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Add the parent directory to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents.seo_research.tools.content_analyzer import ContentAnalyzer
+
+URLS = ["https://example.com/a", "https://example.com/b"]
+
+class ContentAnalyzerCacheTest(unittest.TestCase):
+    """
+    Tests for ContentAnalyzer's in-memory and disk caches.
+    """
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._analyzers = []
+    
+    def tearDown(self):
+        # Let pending background cache writes finish before removing the directory
+        for analyzer in self._analyzers:
+            analyzer._cache_writer.shutdown(wait=True)
+        self._tmp.cleanup()
+    
+    def _analyzer(self, mem_cache_size=512):
+        analyzer = ContentAnalyzer(self._tmp.name, mem_cache_size=mem_cache_size)
+        self._analyzers.append(analyzer)
+        return analyzer
+    
+    def test_memory_cache_evicts_least_recently_used(self):
+        analyzer = self._analyzer(mem_cache_size=2)
+        
+        analyzer.analyze_competitor_content(URLS, "plumber", "Miami")
+        analyzer.analyze_competitor_content(URLS, "hvac", "Miami")
+        # Touch plumber so hvac becomes the least recently used entry
+        analyzer.analyze_competitor_content(URLS, "plumber", "Miami")
+        analyzer.analyze_competitor_content(URLS, "roofer", "Miami")
+        
+        self.assertEqual(len(analyzer._mem_cache), 2)
+        self.assertIn(analyzer._generate_cache_key("plumber", "Miami"), analyzer._mem_cache)
+        self.assertNotIn(analyzer._generate_cache_key("hvac", "Miami"), analyzer._mem_cache)
+    
+    def test_evicted_results_reload_from_disk(self):
+        analyzer = self._analyzer(mem_cache_size=1)
+        first = analyzer.analyze_competitor_content(URLS, "plumber", "Miami")
+        analyzer.analyze_competitor_content(URLS, "hvac", "Miami")
+        analyzer._cache_writer.shutdown(wait=True)
+        
+        reloaded = self._analyzer()
+        self.assertEqual(reloaded.analyze_competitor_content(URLS, "plumber", "Miami"), first)
+    
+    def test_results_are_isolated_from_caller_mutation(self):
+        analyzer = self._analyzer()
+        first = analyzer.analyze_competitor_content(URLS, "plumber", "Miami")
+        first["injected"] = True
+        
+        second = analyzer.analyze_competitor_content(URLS, "plumber", "Miami")
+        self.assertIsNot(second, first)
+        self.assertNotIn("injected", second)
+        
+        second["injected"] = True
+        self.assertNotIn("injected", analyzer.analyze_competitor_content(URLS, "plumber", "Miami"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests for the JSON disk cache shared by the SEO Research Agent tools.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Add the parent directory to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents.seo_research.tools._disk_cache import JsonDiskCache
+
+class JsonDiskCacheTest(unittest.TestCase):
+    """
+    Tests for JsonDiskCache put, flush and reload behaviour.
+    """
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = self._tmp.name
+        self._caches = []
+    
+    def tearDown(self):
+        # Flush now rather than from the atexit hook, after the directory is gone
+        for cache in self._caches:
+            cache.flush()
+        self._tmp.cleanup()
+    
+    def _cache(self, flush_interval_s=3600):
+        cache = JsonDiskCache(self.cache_dir, flush_interval_s=flush_interval_s)
+        self._caches.append(cache)
+        return cache
+    
+    def _files(self):
+        return sorted(os.listdir(self.cache_dir))
+    
+    def test_put_is_buffered_until_flush(self):
+        cache = self._cache()
+        cache.put("plumber_miami", {"keywords": ["plumber miami"]})
+        
+        self.assertEqual(self._files(), [])
+        self.assertEqual(cache.get("plumber_miami"), {"keywords": ["plumber miami"]})
+        
+        cache.flush()
+        self.assertEqual(self._files(), ["plumber_miami.json"])
+    
+    def test_put_flushes_once_interval_elapsed(self):
+        cache = self._cache(flush_interval_s=0)
+        cache.put("plumber_miami", {"keywords": ["plumber miami"]})
+        
+        self.assertEqual(self._files(), ["plumber_miami.json"])
+    
+    def test_flushed_entries_reload_in_new_instance(self):
+        cache = self._cache()
+        cache.put("plumber_miami", {"keywords": ["plumber miami"], "count": 1})
+        cache.flush()
+        
+        reloaded = self._cache()
+        self.assertEqual(reloaded.get("plumber_miami"), {"keywords": ["plumber miami"], "count": 1})
+        self.assertIsNone(reloaded.get("electrician_miami"))
+    
+    def test_results_are_isolated_from_caller_mutation(self):
+        cache = self._cache()
+        value = {"keywords": ["plumber miami"]}
+        cache.put("plumber_miami", value)
+        
+        value["keywords"].append("changed after put")
+        cache.get("plumber_miami")["keywords"].append("changed after get")
+        
+        self.assertEqual(cache.get("plumber_miami"), {"keywords": ["plumber miami"]})
+    
+    def test_make_key_skips_empty_parts(self):
+        self.assertEqual(JsonDiskCache.make_key("Plumber", "New York"), "plumber_new_york")
+        self.assertEqual(JsonDiskCache.make_key("plumber", None), "plumber")
+
+if __name__ == "__main__":
+    unittest.main()
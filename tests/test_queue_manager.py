@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Tests for the task Queue Manager.
+"""
+
+import os
+import sys
+import asyncio
+import tempfile
+import threading
+import unittest
+
+import orjson
+
+# Add the parent directory to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.queue_manager import QueueManager
+
+class QueueManagerTest(unittest.TestCase):
+    """
+    Tests for QueueManager caching and write batching.
+    """
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.queue_path = os.path.join(self._tmp.name, "queue", "task_queue.json")
+        self._managers = []
+    
+    def tearDown(self):
+        # Flush now rather than from the atexit hook, after the directory is gone
+        for manager in self._managers:
+            manager.flush()
+        self._tmp.cleanup()
+    
+    def _manager(self, tasks=None, flush_threshold=64):
+        if tasks is not None:
+            os.makedirs(os.path.dirname(self.queue_path), exist_ok=True)
+            with open(self.queue_path, 'wb') as f:
+                f.write(orjson.dumps(tasks))
+        manager = QueueManager(self.queue_path, flush_threshold=flush_threshold)
+        self._managers.append(manager)
+        return manager
+    
+    def _disk_status(self, task_id):
+        with open(self.queue_path, 'rb') as f:
+            tasks = orjson.loads(f.read())
+        return next(task['status'] for task in tasks if task['task_id'] == task_id)
+    
+    def _tasks(self, count):
+        return [
+            {"task_id": f"plumber_{i}", "service_id": "plumber", "zip": str(i), "status": "pending"}
+            for i in range(count)
+        ]
+    
+    def test_updates_are_written_when_threshold_reached(self):
+        manager = self._manager(self._tasks(3), flush_threshold=2)
+        
+        manager.update_task_status("plumber_0", "published")
+        self.assertEqual(self._disk_status("plumber_0"), "pending")
+        
+        manager.update_task_status("plumber_1", "error")
+        self.assertEqual(self._disk_status("plumber_0"), "published")
+        self.assertEqual(self._disk_status("plumber_1"), "error")
+    
+    def test_flush_writes_pending_updates(self):
+        manager = self._manager(self._tasks(3))
+        
+        manager.update_task_status("plumber_0", "published", {"url": "https://example.com/plumber-0"})
+        self.assertEqual(self._disk_status("plumber_0"), "pending")
+        
+        manager.flush()
+        self.assertEqual(self._disk_status("plumber_0"), "published")
+        self.assertEqual(self._manager().get_task_by_id("plumber_0")["url"], "https://example.com/plumber-0")
+    
+    def test_load_queue_reuses_cache_until_file_changes(self):
+        manager = self._manager(self._tasks(2))
+        queue = manager.load_queue()
+        self.assertIs(manager.load_queue(), queue)
+        
+        # Rewrite the file with a distinct mtime, as another process would
+        with open(self.queue_path, 'wb') as f:
+            f.write(orjson.dumps(self._tasks(3)))
+        stat = os.stat(self.queue_path)
+        os.utime(self.queue_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        reloaded = manager.load_queue()
+        self.assertIsNot(reloaded, queue)
+        self.assertEqual(len(reloaded), 3)
+        self.assertIsNotNone(manager.get_task_by_id("plumber_2"))
+    
+    def test_add_tasks_skips_existing_and_writes_once(self):
+        manager = self._manager(self._tasks(1))
+        
+        added = manager.add_tasks([
+            {"task_id": "plumber_0", "service_id": "plumber", "zip": "0"},
+            {"task_id": "hvac_0", "service_id": "hvac", "zip": "0"},
+            {"service_id": "hvac", "zip": "1"}
+        ])
+        
+        self.assertEqual(added, 1)
+        self.assertEqual(self._disk_status("hvac_0"), "pending")
+        self.assertEqual(len(self._manager().load_queue()), 2)
+    
+    def test_flush_async_keeps_updates_made_during_write(self):
+        manager = self._manager(self._tasks(1))
+        write_started = threading.Event()
+        release_write = threading.Event()
+        write_queue_file = manager._write_queue_file
+        
+        def slow_write(*args):
+            write_started.set()
+            release_write.wait(5)
+            write_queue_file(*args)
+        
+        async def scenario():
+            manager.update_task_status("plumber_0", "in_progress")
+            manager._write_queue_file = slow_write
+            flush = asyncio.ensure_future(manager.flush_async())
+            await asyncio.to_thread(write_started.wait, 5)
+            
+            # Same task updated again while its previous state is being written
+            manager.update_task_status("plumber_0", "published")
+            release_write.set()
+            await flush
+            manager._write_queue_file = write_queue_file
+        
+        asyncio.run(scenario())
+        
+        self.assertEqual(self._disk_status("plumber_0"), "in_progress")
+        self.assertIn("plumber_0", manager._dirty)
+        
+        manager.flush()
+        self.assertEqual(self._disk_status("plumber_0"), "published")
+    
+    def test_flush_async_does_not_overwrite_newer_sync_flush(self):
+        manager = self._manager(self._tasks(2), flush_threshold=2)
+        write_started = threading.Event()
+        release_write = threading.Event()
+        write_queue_file = manager._write_queue_file
+        
+        def slow_write(*args):
+            write_started.set()
+            release_write.wait(5)
+            write_queue_file(*args)
+        
+        async def scenario():
+            manager.update_task_status("plumber_0", "in_progress")
+            manager._write_queue_file = slow_write
+            flush = asyncio.ensure_future(manager.flush_async())
+            await asyncio.to_thread(write_started.wait, 5)
+            manager._write_queue_file = write_queue_file
+            
+            # These reach flush_threshold and save synchronously while the older
+            # async snapshot is still waiting to be written
+            manager.update_task_status("plumber_0", "published")
+            manager.update_task_status("plumber_1", "published")
+            self.assertEqual(self._disk_status("plumber_1"), "published")
+            
+            release_write.set()
+            await flush
+        
+        asyncio.run(scenario())
+        
+        self.assertEqual(self._disk_status("plumber_0"), "published")
+        self.assertEqual(self._disk_status("plumber_1"), "published")
+        self.assertEqual(len(manager._dirty), 0)
+
+if __name__ == "__main__":
+    unittest.main()